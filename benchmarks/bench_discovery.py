@@ -0,0 +1,73 @@
+"""Measure SonyBraviaDiscovery.scan() against local stand-in TVs and dead hosts.
+
+    python benchmarks/bench_discovery.py --tvs 20 --refused 200 --silent 30
+"""
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "custom_components", "braviatv"))
+
+from client.discovery import SonyBraviaDiscovery  # noqa: E402
+from fake_bravia import FakeBravia  # noqa: E402
+
+
+def refused_address():
+    # A port that was just free is closed, connecting to it is refused
+    with socket.socket() as socket_instance:
+        socket_instance.bind(("127.0.0.1", 0))
+        return f"127.0.0.1:{socket_instance.getsockname()[1]}"
+
+
+async def silent_server():
+    # Accepts connections and never answers, like a host that drops packets
+    async def handle(reader, writer):
+        await reader.read()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, f"127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+
+async def run(args):
+    servers = [FakeBravia(name=f"BRAVIA {index}", serial=f"{index:07d}") for index in range(args.tvs)]
+    hosts = [await server.start() for server in servers]
+    silent = [await silent_server() for _ in range(args.silent)]
+    hosts += [address for _, address in silent]
+    hosts += [refused_address() for _ in range(args.refused)]
+
+    discovery = SonyBraviaDiscovery(concurrency=args.concurrency, timeout=args.timeout)
+    try:
+        print(f"hosts={len(hosts)} tvs={args.tvs} silent={args.silent} refused={args.refused} "
+              f"concurrency={args.concurrency} timeout={args.timeout}s")
+        start = time.perf_counter()
+        found = await discovery.scan(hosts)
+        elapsed = time.perf_counter() - start
+        print(f"found={len(found)} elapsed={elapsed * 1000:.1f}ms")
+        if args.verbose:
+            for result in found:
+                print(f"  {result['host']:<22} {result['product_name']} {result['model_name']}")
+    finally:
+        await discovery.close()
+        for server in servers:
+            await server.stop()
+        for server, _ in silent:
+            server.close()
+            await server.wait_closed()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tvs", type=int, default=20)
+    parser.add_argument("--refused", type=int, default=200, help="Hosts that refuse the connection")
+    parser.add_argument("--silent", type=int, default=30, help="Hosts that accept but never answer")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=1.5)
+    parser.add_argument("--verbose", action="store_true", help="List the TVs that were found")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
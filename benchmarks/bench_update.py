@@ -0,0 +1,95 @@
+"""Measure AsyncSonyBraviaClient.update() against a local stand-in TV.
+
+    python benchmarks/bench_update.py --apps 200 --channels 60 --iterations 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "custom_components", "braviatv"))
+
+from client import AsyncSonyBraviaClient  # noqa: E402
+from fake_bravia import DEFAULT_LATENCY, FakeBravia  # noqa: E402
+
+
+def parse_latency(values):
+    latency = {}
+    for value in values:
+        endpoint, _, seconds = value.partition("=")
+        if endpoint not in DEFAULT_LATENCY or not seconds:
+            raise argparse.ArgumentTypeError(f"Invalid endpoint latency: {value}")
+        latency[endpoint] = float(seconds)
+    return latency
+
+
+def report(name, samples):
+    times = sorted(sample[0] for sample in samples)
+    p95 = times[min(len(times) - 1, int(round(0.95 * (len(times) - 1))))]
+    print(
+        f"{name:<10} runs={len(samples):<4} "
+        f"mean={statistics.mean(times) * 1000:8.1f}ms "
+        f"p50={statistics.median(times) * 1000:8.1f}ms "
+        f"p95={p95 * 1000:8.1f}ms "
+        f"max={times[-1] * 1000:8.1f}ms "
+        f"requests={statistics.mean(sample[1] for sample in samples):6.1f} "
+        f"bytes={statistics.mean(sample[2] for sample in samples):10.0f}"
+    )
+
+
+async def measure(client, server):
+    server.reset_stats()
+    start = time.perf_counter()
+    await client.update()
+    elapsed = time.perf_counter() - start
+    return elapsed, server.stats.requests, server.stats.bytes_total
+
+
+async def run(args):
+    server = FakeBravia(
+        apps=args.apps,
+        channels=args.channels,
+        inputs=args.inputs,
+        latency=parse_latency(args.endpoint_latency),
+        jitter=args.jitter,
+        power_status="standby" if args.standby else "active",
+    )
+    host = await server.start()
+    client = AsyncSonyBraviaClient(host=host, psk=server.psk)
+    try:
+        print(f"apps={args.apps} channels={args.channels} inputs={args.inputs} jitter={args.jitter}s latency={server.latency}")
+        report("cold", [await measure(client, server)])
+        report("warm", [await measure(client, server) for _ in range(args.iterations)])
+        samples = []
+        for _ in range(args.iterations):
+            client.invalidate()
+            samples.append(await measure(client, server))
+        report("slow-tier", samples)
+        if args.verbose:
+            server.reset_stats()
+            await client.update()
+            for method, count in sorted(server.stats.methods.items()):
+                print(f"  {method:<34} {count}")
+    finally:
+        await client.close()
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=200)
+    parser.add_argument("--channels", type=int, default=60)
+    parser.add_argument("--inputs", type=int, default=4)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--jitter", type=float, default=0.01, help="Per request latency jitter in seconds")
+    parser.add_argument("--endpoint-latency", action="append", default=[], metavar="ENDPOINT=SECONDS",
+                        help=f"Override the latency of one of: {', '.join(DEFAULT_LATENCY)}")
+    parser.add_argument("--standby", action="store_true", help="Report the TV as being in standby")
+    parser.add_argument("--verbose", action="store_true", help="List the requests made by a warm update")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
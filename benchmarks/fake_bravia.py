@@ -0,0 +1,211 @@
+"""Local stand-in for the BRAVIA REST and IRCC endpoints used by the client."""
+import asyncio
+import collections
+import json
+import random
+
+from aiohttp import web
+
+DEFAULT_LATENCY = {
+    "appControl": 0.08,
+    "audio": 0.03,
+    "avContent": 0.05,
+    "IRCC": 0.03,
+    "system": 0.03,
+}
+
+COMMAND_NAMES = [
+    "Num0", "Num1", "Num2", "Num3", "Num4", "Num5", "Num6", "Num7", "Num8", "Num9",
+    "Up", "Down", "Left", "Right", "Confirm", "Return", "Home", "Options", "Display",
+    "VolumeUp", "VolumeDown", "Mute", "ChannelUp", "ChannelDown", "Input", "PowerOff",
+    "Play", "Pause", "TvPause", "Stop", "Next", "Prev", "Forward", "Rewind", "Netflix",
+]
+
+IRCC_RESPONSE = b"""<?xml version="1.0"?>
+<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/" s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">
+<s:Body><u:X_SendIRCCResponse xmlns:u="urn:schemas-sony-com:service:IRCC:1"></u:X_SendIRCCResponse></s:Body>
+</s:Envelope>"""
+
+
+class FakeBraviaStats(object):
+
+    def __init__(self):
+        self.requests = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.methods = collections.Counter()
+
+    @property
+    def bytes_total(self):
+        return self.bytes_in + self.bytes_out
+
+
+class FakeBravia(object):
+
+    def __init__(self, psk="0000", apps=200, channels=60, inputs=4, latency=None, jitter=0.0,
+                 power_status="active", name="BRAVIA", model="KD-55X85J", serial="1234567", seed=0, icon_size=4096):
+        self.psk = psk
+        self.latency = {**DEFAULT_LATENCY, **(latency or {})}
+        self.jitter = jitter
+        self.power_status = power_status
+        self.random = random.Random(seed)
+        self.stats = FakeBraviaStats()
+        self.runner = None
+        self.icon_size = icon_size
+        self.volume = 15
+        self.mute = False
+        self.playing = dict(source="tv:dvbt", uri="tv:dvbt?trip=1.1.1&srvName=Channel 1", title="Channel 1",
+                            dispNum="001", programTitle="News", startDateTime="2024-01-01T10:00:00+0100",
+                            durationSec=3600)
+        self.interface_info = dict(productCategory="tv", productName="BRAVIA", modelName=model,
+                                   serverName="", interfaceVersion="5.0.1")
+        self.system_info = dict(product="TV", region="XEU", language="eng", model=model, serial=serial,
+                                macAddr="00:11:22:33:44:55", name=name, generation="5.0.1", cid="ABCDEF")
+        self.apps = [
+            dict(title=f"App {index:03d}", uri=f"com.sony.dtv.app{index}", icon=f"http://fake/icons/app{index}.png")
+            for index in range(apps)
+        ]
+        self.channels = [
+            dict(title=f"Channel {index + 1}", uri=f"tv:dvbt?trip=1.1.{index + 1}&srvName=Channel {index + 1}",
+                 dispNum=f"{index + 1:03d}", index=index)
+            for index in range(channels)
+        ]
+        self.inputs = [
+            dict(title=f"HDMI {index + 1}", uri=f"extInput:hdmi?port={index + 1}", label="", icon="meta:hdmi",
+                 connection=bool(index == 0), status="true")
+            for index in range(inputs)
+        ]
+        self.commands = [dict(name=name, value=f"AAAAAQAAAAEAAA{index:03d}Aw==") for index, name in enumerate(COMMAND_NAMES)]
+
+    @property
+    def address(self):
+        host, port = self.runner.addresses[0][:2]
+        return f"{host}:{port}"
+
+    async def start(self, host="127.0.0.1", port=0):
+        app = web.Application()
+        app.router.add_post("/sony/IRCC", self.handle_ircc)
+        app.router.add_post("/sony/{endpoint}", self.handle_json)
+        app.router.add_get("/icons/{name}", self.handle_icon)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host, port).start()
+        return self.address
+
+    async def stop(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+    def reset_stats(self):
+        self.stats = FakeBraviaStats()
+
+    async def delay(self, endpoint):
+        latency = self.latency.get(endpoint, 0.0)
+        if self.jitter:
+            latency = max(0.0, latency + self.random.uniform(-self.jitter, self.jitter))
+        if latency:
+            await asyncio.sleep(latency)
+
+    async def handle_ircc(self, request):
+        body = await request.read()
+        await self.delay("IRCC")
+        self.stats.requests += 1
+        self.stats.bytes_in += len(body)
+        self.stats.bytes_out += len(IRCC_RESPONSE)
+        self.stats.methods["IRCC"] += 1
+        if request.headers.get("X-Auth-PSK") != self.psk:
+            return web.Response(status=403)
+        return web.Response(body=IRCC_RESPONSE, content_type="text/xml")
+
+    def get_icon(self, name):
+        # PNG signature followed by bytes that only depend on the name
+        icon_random = random.Random(name)
+        return b"\x89PNG\r\n\x1a\n" + icon_random.randbytes(self.icon_size - 8)
+
+    async def handle_icon(self, request):
+        content = self.get_icon(request.match_info["name"])
+        self.stats.requests += 1
+        self.stats.bytes_out += len(content)
+        self.stats.methods["icon"] += 1
+        return web.Response(body=content, content_type="image/png")
+
+    async def handle_json(self, request):
+        endpoint = request.match_info["endpoint"]
+        body = await request.read()
+        payload = json.loads(body)
+        method = payload.get("method")
+        await self.delay(endpoint)
+
+        if request.headers.get("X-Auth-PSK") != self.psk and method != "getInterfaceInformation":
+            response = dict(error=[403, "Forbidden"], id=payload.get("id"))
+        else:
+            handler = getattr(self, f"{endpoint}_{method}", None)
+            if handler is None:
+                response = dict(error=[12, "No Such Method"], id=payload.get("id"))
+            else:
+                response = dict(result=handler(*payload.get("params", [])), id=payload.get("id"))
+
+        content = json.dumps(response).encode("utf-8")
+        self.stats.requests += 1
+        self.stats.bytes_in += len(body)
+        self.stats.bytes_out += len(content)
+        self.stats.methods[method] += 1
+        return web.Response(body=content, content_type="application/json")
+
+    def appControl_getApplicationList(self):
+        return [self.apps]
+
+    def appControl_setActiveApp(self, params):
+        self.playing = {}
+        return []
+
+    def audio_getVolumeInformation(self):
+        return [[
+            dict(target="speaker", volume=self.volume, mute=self.mute, maxVolume=100, minVolume=0),
+            dict(target="headphone", volume=10, mute=False, maxVolume=100, minVolume=0),
+        ]]
+
+    def audio_setAudioMute(self, params):
+        self.mute = bool(params["status"])
+        return [0]
+
+    def audio_setAudioVolume(self, params):
+        self.volume = int(params["volume"])
+        return [0]
+
+    def avContent_getContentList(self, params):
+        if params["source"].startswith("tv:"):
+            return [self.channels]
+        return [[dict(title=item["title"], uri=item["uri"], index=index) for index, item in enumerate(self.inputs)]]
+
+    def avContent_getCurrentExternalInputsStatus(self):
+        return [self.inputs]
+
+    def avContent_getPlayingContentInfo(self):
+        return [self.playing]
+
+    def avContent_getSourceList(self, params):
+        if params["scheme"] == "tv":
+            return [[dict(source="tv:dvbt")]]
+        return [[dict(source="extInput:hdmi"), dict(source="extInput:widi")]]
+
+    def avContent_setPlayContent(self, params):
+        self.playing = dict(source=params["uri"].split("?")[0], uri=params["uri"], title=params["uri"])
+        return [0]
+
+    def system_getInterfaceInformation(self):
+        return [self.interface_info]
+
+    def system_getPowerStatus(self):
+        return [dict(status=self.power_status)]
+
+    def system_getRemoteControllerInfo(self):
+        return [dict(bundled=True, type="IR_REMOTE_BUNDLE_TYPE_AEP_N"), self.commands]
+
+    def system_getSystemInformation(self):
+        return [self.system_info]
+
+    def system_setPowerStatus(self, params):
+        self.power_status = "active" if params["status"] else "standby"
+        return []
@@ -1,8 +1,6 @@
 """Support for interface with a Sony Bravia TV."""
 from __future__ import annotations
 
-from datetime import timedelta
-import async_timeout
 import logging
 
 from homeassistant.const import (
@@ -12,17 +10,15 @@ from homeassistant.const import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .client import SonyBraviaClient, SonyBraviaException
 from .client.device import SonyBraviaDevice
 from .const import (
+    DATA_CLIENT,
     DATA_COORDINATOR,
+    DATA_HUB,
     CONF_EXT_SPEAKER,
     CONF_PSK,
     CONF_SAVE_RESPONSES,
@@ -40,8 +36,11 @@ from .const import (
     MANUFACTURER,
     UNDO_UPDATE_LISTENER,
 )
+from .coordinator import SonyBraviaCoordinator
+from .hub import async_get_hub
+from .services import async_setup_services, async_unload_services
 
-PLATFORMS = [Platform.MEDIA_PLAYER, Platform.REMOTE]
+PLATFORMS = [Platform.MEDIA_PLAYER, Platform.REMOTE, Platform.SENSOR]
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,40 +56,44 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 
     conf_save_location = DEFAULT_SAVE_LOCATION if conf_save_responses else None
 
-    client = SonyBraviaClient(host=data[CONF_HOST], psk=data[CONF_PSK], save_location=conf_save_location)
-
-    async def async_update_data():
-        """Fetch data from API endpoint.
-
-        This is the place to pre-process the data to lookup tables
-        so entities can quickly look up their data.
-        """
-        try:
-            async with async_timeout.timeout(conf_timeout):
-                return await hass.async_add_executor_job(client.update)
-        except SonyBraviaException as exception:
-            raise UpdateFailed(f"Error communicating with API: {exception}")
+    hub = async_get_hub(hass)
+    await hub.async_load()
+    if not hub.clients:
+        async_setup_services(hass)
+    client = hub.create_client(config_entry.entry_id, data[CONF_HOST], data[CONF_PSK], conf_save_location)
 
-    coordinator = DataUpdateCoordinator(
+    coordinator = SonyBraviaCoordinator(
         hass=hass,
-        logger=_LOGGER,
-        name=f"Sony BRAVIA ({data[CONF_HOST]})",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=conf_scan_interval),
+        client=client,
+        scan_interval=conf_scan_interval,
+        timeout=conf_timeout,
+        hub=hub,
     )
-    await coordinator.async_config_entry_first_refresh()
+    restored = client.device is not None
+    if restored:
+        # Entities start from the metadata saved by the last run while the TV is polled in the background
+        coordinator.data = client.device
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            await async_remove_client(hass, config_entry.entry_id)
+            raise
 
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][config_entry.entry_id] = {
         CONF_EXT_SPEAKER: options.get(CONF_EXT_SPEAKER, data.get(CONF_EXT_SPEAKER, DEFAULT_EXT_SPEAKER)),
         CONF_SOURCE_CONFIG: options.get(CONF_SOURCE_CONFIG, data.get(CONF_SOURCE_CONFIG, DEFAULT_SOURCE_CONFIG)),
         CONF_TIME_FORMAT: options.get(CONF_TIME_FORMAT, data.get(CONF_TIME_FORMAT, DEFAULT_TIME_FORMAT)),
+        DATA_CLIENT: client,
         DATA_COORDINATOR: coordinator,
         UNDO_UPDATE_LISTENER: config_entry.add_update_listener(async_update_listener),
     }
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
+    if restored:
+        config_entry.async_create_background_task(hass, coordinator.async_refresh(), f"{coordinator.name} first refresh")
+
     return True
 
 
@@ -101,11 +104,30 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     )
     if unload_ok:
         hass.data[DOMAIN][config_entry.entry_id][UNDO_UPDATE_LISTENER]()
-        hass.data[DOMAIN].pop(config_entry.entry_id)
+        entry = hass.data[DOMAIN].pop(config_entry.entry_id)
+        entry[DATA_COORDINATOR].async_cancel_confirm()
+        await async_remove_client(hass, config_entry.entry_id)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the metadata saved for a config entry."""
+    hub = async_get_hub(hass)
+    await hub.async_load()
+    await hub.async_remove_metadata(config_entry.entry_id)
+
+
+async def async_remove_client(hass: HomeAssistant, entry_id: str) -> None:
+    """Close the client of an entry, and the hub along with the last one."""
+    hub = hass.data[DOMAIN][DATA_HUB]
+    await hub.async_remove_client(entry_id)
+    if not hub.clients:
+        async_unload_services(hass)
+        hass.data[DOMAIN].pop(DATA_HUB)
+        await hub.async_close()
+
+
 async def async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(config_entry.entry_id)
@@ -114,7 +136,9 @@ async def async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry)
 class SonyBraviaEntity(CoordinatorEntity):
     """Representation of a Sony BRAVIA device."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator):
+    coordinator: SonyBraviaCoordinator
+
+    def __init__(self, coordinator: SonyBraviaCoordinator):
         """Initialize device."""
         super().__init__(coordinator)
 
@@ -123,6 +147,11 @@ class SonyBraviaEntity(CoordinatorEntity):
         """Return information about the device."""
         return self.coordinator.data
 
+    @property
+    def available(self) -> bool:
+        """Return if the power status of the device is known."""
+        return super().available and self.device.available
+
     @property
     def device_info(self) -> DeviceInfo | None:
         """Return information about the device."""
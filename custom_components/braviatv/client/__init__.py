@@ -1,73 +1,178 @@
 """Sony Bravia Client"""
+import aiohttp
+import asyncio
+import contextlib
 import datetime
 import json
-import os
-import requests
 import socket
 import struct
 import time
 
 from .const import (
+    CONCURRENCY,
     IRCC_DATA,
     IRCC_HEADERS,
+    IRCC_HOLD_INTERVAL,
+    METADATA,
     MINIMUM_UPDATE_INTERVAL,
+    POOL_SIZE,
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    PRIORITY_REFRESH,
+    PROBE_TIMEOUT,
+    SLOW_TIER_TTL,
     TIMEOUT,
     VALID_EXT_INPUT_SCHEMES,
     VALID_TV_SCHEMES,
 )
-from .device import SonyBraviaDevice
+from .breaker import SonyBraviaCircuitBreaker
+from .device import SonyBraviaDevice, SonyBraviaInfo, SonyBraviaMetadata
+from .recorder import SonyBraviaRecorder
+from .scheduler import SonyBraviaScheduler
+from .stats import SonyBraviaStats
 
 
 class SonyBraviaException(Exception):
     """Raised when an update has failed."""
 
 
-class SonyBraviaClient(object):
+class SonyBraviaConnectionError(SonyBraviaException):
+    """Raised when the TV cannot be reached."""
 
-    def __init__(self, host, psk, save_location=None):
+
+class SonyBraviaTimeoutError(SonyBraviaConnectionError):
+    """Raised when the TV does not answer in time."""
+
+
+class SonyBraviaResponseError(SonyBraviaException):
+    """Raised when the TV answers with an error or an invalid response."""
+
+
+class SonyBraviaPreemptedError(SonyBraviaException):
+    """Raised when a request was cancelled to make room for a user command."""
+
+
+class AsyncSonyBraviaClient(object):
+
+    def __init__(self, host, psk, save_location=None, pool_size=POOL_SIZE, slow_tier_ttl=SLOW_TIER_TTL, session=None, concurrency=CONCURRENCY, limiter=None):
         self.host = host
         self.psk = psk
-        self.data = {}
+        self.data = dict(
+            power_status=None,
+            interface_info={},
+            system_info={},
+            apps={},
+            commands={},
+            source_contents=[],
+            input_labels={},
+            volume_info={},
+            playing_info={},
+        )
+        self.device = None
+        self.info_expired = False
         self.last_update_timestamp = time.time()
         self.save_location = save_location
+        self.recorder = SonyBraviaRecorder(save_location) if save_location else None
+        self.slow_tier_timestamp = None
+        self.slow_tier_ttl = slow_tier_ttl
+        self.stats = SonyBraviaStats()
+        self.headers = self.auth_header
+        self.ircc_headers = {**self.headers, **IRCC_HEADERS}
+        self.ircc_payloads = {}
+        self.applied = {}
+        self.pool_size = pool_size
+        self.breaker = SonyBraviaCircuitBreaker()
+        self.scheduler = SonyBraviaScheduler(concurrency)
+        # Shared with other clients to bound the polls in flight across every TV
+        self.limiter = limiter or contextlib.nullcontext()
+        self.sequence_lock = asyncio.Lock()
+        self.session = session
+        self.owns_session = bool(session is None)
+        self.source_contents = {}
+        self.volume_target = None
+        self.volume_task = None
 
     @property
     def auth_header(self):
         return {"X-Auth-PSK": self.psk}
 
-    def send_ircc(self, code):
-        if code is None:
-            return
-        try:
-            response = requests.post(
-                url=f"http://{self.host}/sony/IRCC",
-                data=IRCC_DATA.format(code).encode("UTF-8"),
-                headers={**self.auth_header, **IRCC_HEADERS},
-                timeout=TIMEOUT,
-            )
-        except (requests.exceptions.HTTPError, requests.exceptions.Timeout, Exception) as exception_instance:
-            raise SonyBraviaException(f"HTTPError: {str(exception_instance)}")
+    @property
+    def slow_tier_expired(self):
+        if self.slow_tier_timestamp is None:
+            return True
+        return bool(time.time() - self.slow_tier_timestamp > self.slow_tier_ttl)
+
+    def invalidate(self):
+        self.slow_tier_timestamp = None
+        self.source_contents = {}
+
+    def get_ircc_payload(self, code):
+        payload = self.ircc_payloads.get(code)
+        if payload is None:
+            payload = IRCC_DATA.format(code).encode("UTF-8")
+        return payload
+
+    def set_ircc_payloads(self, commands):
+        # Key presses reuse the encoded envelope instead of formatting it every time
+        self.ircc_payloads = {code: IRCC_DATA.format(code).encode("UTF-8") for code in commands.values()}
+
+    def get_device(self):
+        # Updates replace values in self.data instead of mutating them, so parts that
+        # did not change are shared by reference with the previous snapshot
+        data = self.data
+        previous = self.device
+        info = previous.info if previous else None
+        if info is None or info.interface_info is not data["interface_info"] or info.system_info is not data["system_info"]:
+            info = SonyBraviaInfo(data["interface_info"], data["system_info"])
+        metadata = previous.metadata if previous else None
+        if (metadata is None or metadata.apps is not data["apps"] or metadata.commands is not data["commands"]
+                or metadata.source_contents is not data["source_contents"]):
+            metadata = SonyBraviaMetadata(data["apps"], data["commands"], data["source_contents"])
+
+        if previous and previous.metadata is metadata and previous.input_labels == data["input_labels"]:
+            sources, source_index = previous.sources, previous.source_index
         else:
-            content = response.content
-            return content
-
-    def send_json(self, endpoint, method, id, params, version):
-        data = dict(method=method, id=id, params=params, version=version)
-        try:
-            response = requests.post(
-                url=f"http://{self.host}/sony/{endpoint}",
-                data=json.dumps(data).encode("UTF-8"),
-                headers=self.auth_header,
-                timeout=TIMEOUT,
-            )
-        except (requests.exceptions.HTTPError, requests.exceptions.Timeout, Exception) as exception_instance:
-            raise SonyBraviaException(f"HTTPError: {str(exception_instance)}")
+            sources, source_index = self.parse_sources(data["source_contents"], data["input_labels"]), None
+        if previous and previous.playing_info is data["playing_info"]:
+            playing_time = previous.playing_time
         else:
-            response = json.loads(response.content.decode("utf-8"))
-            if "error" in response:
-                raise SonyBraviaException(f"Invalid response: {response},\nendpoint: {endpoint},\nmethod: {method},\nparams: {params},\ndata: {data}")
-            self.save_response(response=response, name=method)
-            return response
+            playing_time = self.get_playing_time(data["playing_info"])
+
+        self.device = SonyBraviaDevice(
+            client=self,
+            info=info,
+            metadata=metadata,
+            power_status=data["power_status"],
+            volume_info=data["volume_info"],
+            playing_info=data["playing_info"],
+            playing_time=playing_time,
+            input_labels=data["input_labels"],
+            sources=sources,
+            source_index=source_index,
+        )
+        return self.device
+
+    def apply(self, **values):
+        # Expected results of an action, until the TV confirms them
+        for key in values:
+            self.applied[key] = self.applied.get(key, 0) + 1
+        self.data.update(values)
+        return self.get_device()
+
+    def restore(self, metadata, expired=True):
+        # Metadata saved by an earlier run, served until the TV confirms it
+        for key in METADATA:
+            if metadata.get(key):
+                self.data[key] = metadata[key]
+        self.set_ircc_payloads(self.data["commands"])
+        self.slow_tier_timestamp = metadata.get("timestamp")
+        self.info_expired = expired
+        return self.get_device()
+
+    def export(self):
+        metadata = {key: self.data[key] for key in METADATA}
+        metadata["timestamp"] = self.slow_tier_timestamp
+        return metadata
 
     def define_end_time(self, tm, secs):
         fulldate = datetime.datetime(100, 1, 1, tm.hour, tm.minute, tm.second)
@@ -75,53 +180,11 @@ class SonyBraviaClient(object):
         return fulldate.time()
 
     def save_response(self, response, name="response"):
-        if self.save_location and response:
-            if not os.path.isdir(self.save_location):
-                os.mkdir(self.save_location)
-            name = name.replace("/", "_").replace(".", "_")
-            with open(f"{self.save_location}/{name}.json", "w") as file:
-                json.dump(response, file, default=lambda o: "not-serializable", indent=4, sort_keys=True)
-            file.close()
-
-    def update(self):
-        try:
-            if time.time() - self.last_update_timestamp <= MINIMUM_UPDATE_INTERVAL:
-                return self.data
-
-            self.data["power_status"] = self.get_power_status()
-
-            if not self.data.get("interface_info"):
-                self.data["interface_info"] = self.get_interface_info()
+        if self.recorder and response:
+            self.recorder.record(response, name)
 
-            if not self.data.get("system_info"):
-                self.data["system_info"] = self.get_system_info()
-
-            if self.data["power_status"] != "active":
-                self.last_update_timestamp = time.time()
-                return SonyBraviaDevice(self, self.data)
-
-            self.data["apps"] = self.get_apps()
-            self.data["commands"] = self.get_commands()
-            self.data["sources"] = self.get_sources()
-            self.data["volume_info"] = self.get_volume_info()
-            self.data["playing_info"] = self.get_playing_info()
-            self.data["playing_time"] = self.get_playing_time(self.data["playing_info"])
-            self.save_response(response=self.data, name="update")
-
-            self.last_update_timestamp = time.time()
-        except SonyBraviaException:
-            return SonyBraviaDevice(self, self.data)
-        return SonyBraviaDevice(self, self.data)
-
-    def get_apps(self):
+    def parse_apps(self, response):
         _apps = []
-        response = self.send_json(
-            endpoint="appControl",
-            method="getApplicationList",
-            id=60,
-            params=[],
-            version="1.0",
-        )
         if not response.get("error"):
             _apps.extend(response.get("result")[0])
 
@@ -136,15 +199,8 @@ class SonyBraviaClient(object):
                 apps[title]["icon"] = icon
         return apps
 
-    def get_commands(self):
+    def parse_commands(self, response):
         _commands = []
-        response = self.send_json(
-            endpoint="system",
-            method="getRemoteControllerInfo",
-            id=54,
-            params=[],
-            version="1.0",
-        )
         if not response.get("error"):
             _commands.extend(response.get("result")[1])
 
@@ -153,32 +209,79 @@ class SonyBraviaClient(object):
             commands[command["name"]] = command["value"]
         return commands
 
-    def get_interface_info(self):
+    def parse_content_list(self, response):
+        contents = []
+        if not response.get("error"):
+            contents.extend(response.get("result")[0])
+        return contents
+
+    def parse_input_labels(self, response):
+        _input_labels = []
+        if not response.get("error"):
+            _input_labels.extend(response.get("result")[0])
+
+        input_labels = {}
+        for input in _input_labels:
+            if input["label"]:
+                input_labels[input["title"]] = input["label"]
+        return input_labels
+
+    def parse_interface_info(self, response):
         interface_info = {}
-        response = self.send_json(
-            endpoint="system",
-            method="getInterfaceInformation",
-            id=33,
-            params=[],
-            version="1.0",
-        )
         if not response.get("error"):
             interface_info = response.get("result")[0]
         return interface_info
 
-    def get_playing_info(self):
+    def parse_playing_info(self, response):
         playing_info = {}
-        response = self.send_json(
-            endpoint="avContent",
-            method="getPlayingContentInfo",
-            id=103,
-            params=[],
-            version="1.0",
-        )
         if not response.get("error"):
             playing_info = response.get("result")[0]
         return playing_info
 
+    def parse_power_status(self, response):
+        power_status = None
+        if not response.get("error"):
+            power_status = response.get("result")[0].get("status")
+        return power_status
+
+    def parse_source_list(self, response, valid_schemes):
+        source_list = []
+        if not response.get("error"):
+            for result in response.get("result")[0]:
+                if result["source"] in valid_schemes:
+                    source_list.append(result)
+        return source_list
+
+    def parse_response(self, endpoint, method, content):
+        try:
+            return json.loads(content.decode("utf-8"))
+        except ValueError as exception_instance:
+            self.stats.record_error(endpoint, method, type(exception_instance).__name__)
+            raise SonyBraviaResponseError(f"Invalid response: {content[:100]},\nendpoint: {endpoint},\nmethod: {method}")
+
+    def parse_sources(self, contents, input_labels):
+        sources = {}
+        for source in contents:
+            label = input_labels.get(source["title"], source["title"])
+            if label:
+                sources[label] = source["uri"]
+        return sources
+
+    def parse_system_info(self, response):
+        system_info = {}
+        if not response.get("error"):
+            system_info = response.get("result")[0]
+        return system_info
+
+    def parse_volume_info(self, response):
+        volume_info = {}
+        if not response.get("error"):
+            results = response.get("result")[0]
+            for result in results:
+                if result["target"] == "speaker":
+                    volume_info = result
+        return volume_info
+
     def get_playing_time(self, playing_info):
         # startdatetime format 2017-03-24T00:00:00+0100
         playing_time = {}
@@ -196,129 +299,398 @@ class SonyBraviaClient(object):
             playing_time = dict(start_time=start_time, end_time=end_time)
         return playing_time
 
-    def get_power_status(self):
-        power_status = None
-        response = self.send_json(
-            endpoint="system",
-            method="getPowerStatus",
-            id=50,
+    def wake_on_lan(self, mac_address):
+        if mac_address:
+            addr_byte = mac_address.split(":")
+            hw_addr = struct.pack(
+                "BBBBBB",
+                int(addr_byte[0], 16),
+                int(addr_byte[1], 16),
+                int(addr_byte[2], 16),
+                int(addr_byte[3], 16),
+                int(addr_byte[4], 16),
+                int(addr_byte[5], 16),
+            )
+            msg = b"\xff" * 6 + hw_addr * 16
+            socket_instance = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            socket_instance.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            socket_instance.sendto(msg, ("<broadcast>", 9))
+            socket_instance.close()
+
+    def get_session(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=self.pool_size),
+            )
+        return self.session
+
+    def complete_slow_tier(self):
+        # The next refresh starts over, content lists can change without the scheme list changing
+        self.slow_tier_timestamp = time.time()
+        self.source_contents = {}
+
+    async def close(self):
+        if self.recorder:
+            self.recorder.close()
+        if self.owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _post(self, url, data, headers, timeout):
+        async with self.get_session().post(
+            url,
+            data=data,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            return await response.read()
+
+    async def post(self, endpoint, data, headers=None, timeout=TIMEOUT, method=None, priority=PRIORITY_COMMAND):
+        url = f"http://{self.host}/sony/{endpoint}"
+        headers = headers or self.headers
+        task = asyncio.current_task()
+        await self.scheduler.acquire(priority)
+        start = time.monotonic()
+        # Commands skip the limit shared with other TVs, they must not wait behind their polls
+        limiter = contextlib.nullcontext() if priority == PRIORITY_COMMAND else self.limiter
+        try:
+            async with limiter:
+                try:
+                    content = await self._post(url, data, headers, timeout)
+                except aiohttp.ServerDisconnectedError:
+                    # The TV drops idle keep-alive sockets, retry once on a fresh connection
+                    content = await self._post(url, data, headers, timeout)
+        except asyncio.CancelledError:
+            if not self.scheduler.was_preempted(task):
+                raise
+            # Only this request was cancelled, the task itself carries on
+            if task.uncancel():
+                raise
+            self.stats.record(endpoint, method, time.monotonic() - start, error="Preempted")
+            raise SonyBraviaPreemptedError(f"Preempted: {endpoint},\nmethod: {method}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, Exception) as exception_instance:
+            self.stats.record(endpoint, method, time.monotonic() - start, error=type(exception_instance).__name__)
+            if isinstance(exception_instance, asyncio.TimeoutError):
+                raise SonyBraviaTimeoutError(f"HTTPError: {str(exception_instance)}")
+            raise SonyBraviaConnectionError(f"HTTPError: {str(exception_instance)}")
+        finally:
+            self.scheduler.release(task)
+        self.stats.record(endpoint, method, time.monotonic() - start, len(content))
+        return content
+
+    async def send_ircc(self, code):
+        if code is None:
+            return
+        return await self.post(
+            endpoint="IRCC",
+            data=self.get_ircc_payload(code),
+            headers=self.ircc_headers,
+            method="X_SendIRCC",
+        )
+
+    async def send_ircc_sequence(self, codes, repeats=1, delay=0.0, hold=0.0):
+        # Keys are paced from the start of the previous press so slow responses do not add drift
+        loop = asyncio.get_running_loop()
+        async with self.sequence_lock:
+            deadline = loop.time()
+            for _ in range(repeats):
+                for code in codes:
+                    await asyncio.sleep(max(0.0, deadline - loop.time()))
+                    start = press = loop.time()
+                    await self.send_ircc(code)
+                    # Holding a key repeats it until the hold time has passed
+                    while press + IRCC_HOLD_INTERVAL <= start + hold:
+                        press += IRCC_HOLD_INTERVAL
+                        await asyncio.sleep(max(0.0, press - loop.time()))
+                        await self.send_ircc(code)
+                    deadline = press + delay
+
+    async def send_json(self, endpoint, method, id, params, version, timeout=TIMEOUT, priority=PRIORITY_COMMAND):
+        data = dict(method=method, id=id, params=params, version=version)
+        content = await self.post(
+            endpoint=endpoint,
+            data=json.dumps(data).encode("UTF-8"),
+            timeout=timeout,
+            method=method,
+            priority=priority,
+        )
+        response = self.parse_response(endpoint, method, content)
+        if "error" in response:
+            self.stats.record_error(endpoint, method, "ErrorResponse")
+            raise SonyBraviaResponseError(f"Invalid response: {response},\nendpoint: {endpoint},\nmethod: {method},\nparams: {params},\ndata: {data}")
+        self.save_response(response=response, name=method)
+        return response
+
+    async def set_volume(self, volume):
+        # Only the newest target is kept while a request is in flight, a burst costs at most two requests
+        self.volume_target = volume
+        if self.volume_task is None or self.volume_task.done():
+            self.volume_task = asyncio.ensure_future(self.send_volume())
+        return await asyncio.shield(self.volume_task)
+
+    async def send_volume(self):
+        try:
+            while self.volume_target is not None:
+                volume, self.volume_target = self.volume_target, None
+                response = await self.send_json(
+                    endpoint="audio",
+                    method="setAudioVolume",
+                    id=98,
+                    params=[dict(target="speaker", volume=volume, ui="on")],
+                    version="1.2",
+                )
+        finally:
+            self.volume_target = None
+        return response
+
+    async def gather_data(self, calls):
+        # Merge every successful result and return the failures by key
+        applied = {key: self.applied.get(key) for key in calls}
+        results = await asyncio.gather(*calls.values(), return_exceptions=True)
+        exceptions = {}
+        for key, result in zip(calls, results):
+            if isinstance(result, BaseException):
+                exceptions[key] = result
+            elif self.applied.get(key) == applied[key]:
+                # Results read before an action was applied would overwrite its expected value
+                self.data[key] = result
+        return exceptions
+
+    async def update_data(self, calls):
+        exceptions = await self.gather_data(calls)
+        if exceptions:
+            raise next(iter(exceptions.values()))
+
+    async def prefetch(self):
+        # Everything a new entry needs in one round, parts the TV refuses while off stay empty
+        exceptions = await self.gather_data(dict(
+            power_status=self.get_power_status(),
+            interface_info=self.get_interface_info(),
+            system_info=self.get_system_info(),
+            volume_info=self.get_volume_info(),
+            playing_info=self.get_playing_info(),
+            input_labels=self.get_input_labels(),
+            apps=self.get_apps(),
+            commands=self.get_commands(),
+            source_contents=self.get_source_contents(),
+        ))
+        if not exceptions.keys() & {"apps", "commands", "source_contents"}:
+            self.complete_slow_tier()
+        self.info_expired = bool(exceptions.keys() & {"interface_info", "system_info"})
+        return self.get_device()
+
+    async def probe(self):
+        # Unreachable TVs only get a short liveness probe until they answer again
+        timeout = PROBE_TIMEOUT if self.breaker.is_open else TIMEOUT
+        try:
+            power_status = await self.get_power_status(timeout=timeout)
+        except SonyBraviaPreemptedError:
+            raise
+        except SonyBraviaException:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return power_status
+
+    async def confirm(self, *keys):
+        getters = dict(
+            power_status=self.get_power_status,
+            volume_info=self.get_volume_info,
+            playing_info=self.get_playing_info,
+        )
+        await self.update_data({key: getters[key]() for key in keys})
+        return self.get_device()
+
+    async def update(self):
+        if not self.breaker.allow():
+            raise SonyBraviaConnectionError(f"Host unreachable: {self.host}, next probe in {int(self.breaker.retry_in)}s")
+        try:
+            if time.time() - self.last_update_timestamp <= MINIMUM_UPDATE_INTERVAL:
+                return self.get_device()
+
+            calls = dict(power_status=self.probe())
+            # While the breaker is open only the short probe runs, info waits until the TV answers
+            refresh_info = not self.breaker.is_open
+            if refresh_info and (self.info_expired or not self.data["interface_info"]):
+                calls["interface_info"] = self.get_interface_info()
+            if refresh_info and (self.info_expired or not self.data["system_info"]):
+                calls["system_info"] = self.get_system_info()
+            await self.update_data(calls)
+            if refresh_info:
+                self.info_expired = False
+
+            if self.data["power_status"] != "active":
+                self.last_update_timestamp = time.time()
+                return self.get_device()
+
+            slow_tier_expired = self.slow_tier_expired
+            calls = dict(
+                volume_info=self.get_volume_info(),
+                playing_info=self.get_playing_info(),
+                input_labels=self.get_input_labels(),
+            )
+            if slow_tier_expired:
+                calls.update(
+                    apps=self.get_apps(),
+                    commands=self.get_commands(),
+                    source_contents=self.get_source_contents(),
+                )
+            await self.update_data(calls)
+            if slow_tier_expired:
+                self.complete_slow_tier()
+            self.save_response(response=dict(self.data), name="update")
+
+            self.last_update_timestamp = time.time()
+        except SonyBraviaException:
+            if self.breaker.is_open:
+                raise
+            return self.get_device()
+        return self.get_device()
+
+    async def get_apps(self):
+        response = await self.send_json(
+            endpoint="appControl",
+            method="getApplicationList",
+            id=60,
             params=[],
             version="1.0",
+            priority=PRIORITY_REFRESH,
         )
-        if not response.get("error"):
-            power_status = response.get("result")[0].get("status")
-        return power_status
+        return self.parse_apps(response)
 
-    def get_sources(self):
-        _sources = []
-        response = self.send_json(
-            endpoint="avContent",
-            method="getSourceList",
-            id=1,
-            params=[dict(scheme="tv")],
+    async def get_commands(self):
+        response = await self.send_json(
+            endpoint="system",
+            method="getRemoteControllerInfo",
+            id=54,
+            params=[],
             version="1.0",
+            priority=PRIORITY_REFRESH,
         )
-        if not response.get("error"):
-            results = response.get("result")[0]
-            for result in results:
-                if result["source"] in VALID_TV_SCHEMES:
-                    response = self.send_json(
-                        endpoint="avContent",
-                        method="getContentList",
-                        id=88,
-                        params=[result],
-                        version="1.0",
-                    )
-                    if not response.get("error"):
-                        _sources.extend(response.get("result")[0])
-
-        response = self.send_json(
+        commands = self.parse_commands(response)
+        self.set_ircc_payloads(commands)
+        return commands
+
+    async def get_content_list(self, scheme):
+        response = await self.send_json(
             endpoint="avContent",
-            method="getSourceList",
-            id=1,
-            params=[dict(scheme="extInput")],
+            method="getContentList",
+            id=88,
+            params=[scheme],
             version="1.0",
+            priority=PRIORITY_REFRESH,
         )
-        if not response.get("error"):
-            results = response.get("result")[0]
-            for result in results:
-                if result["source"] in VALID_EXT_INPUT_SCHEMES:
-                    response = self.send_json(
-                        endpoint="avContent",
-                        method="getContentList",
-                        id=88,
-                        params=[result],
-                        version="1.0",
-                    )
-                    if not response.get("error"):
-                        _sources.extend(response.get("result")[0])
+        return self.parse_content_list(response)
 
-        _input_labels = []
-        response = self.send_json(
+    async def get_input_labels(self):
+        response = await self.send_json(
             endpoint="avContent",
             method="getCurrentExternalInputsStatus",
             id=105,
             params=[],
             version="1.1",
+            priority=PRIORITY_POLL,
         )
-        if not response.get("error"):
-            _input_labels.extend(response.get("result")[0])
+        return self.parse_input_labels(response)
 
-        input_labels = {}
-        for input in _input_labels:
-            if input["label"]:
-                input_labels[input["title"]] = input["label"]
+    async def get_interface_info(self):
+        response = await self.send_json(
+            endpoint="system",
+            method="getInterfaceInformation",
+            id=33,
+            params=[],
+            version="1.0",
+            priority=PRIORITY_POLL,
+        )
+        return self.parse_interface_info(response)
 
-        sources = {}
-        for source in _sources:
-            label = input_labels.get(source["title"], source["title"])
-            if label:
-                sources[label] = source["uri"]
-        return sources
+    async def get_playing_info(self):
+        response = await self.send_json(
+            endpoint="avContent",
+            method="getPlayingContentInfo",
+            id=103,
+            params=[],
+            version="1.0",
+            priority=PRIORITY_POLL,
+        )
+        return self.parse_playing_info(response)
 
-    def get_system_info(self):
-        system_info = {}
-        response = self.send_json(
+    async def get_power_status(self, timeout=TIMEOUT):
+        response = await self.send_json(
+            endpoint="system",
+            method="getPowerStatus",
+            id=50,
+            params=[],
+            version="1.0",
+            timeout=timeout,
+            priority=PRIORITY_POLL,
+        )
+        return self.parse_power_status(response)
+
+    async def get_source_contents(self):
+        tv_schemes, ext_input_schemes = await asyncio.gather(
+            self.get_source_list("tv", VALID_TV_SCHEMES),
+            self.get_source_list("extInput", VALID_EXT_INPUT_SCHEMES),
+        )
+        schemes = {scheme["source"]: scheme for scheme in tv_schemes + ext_input_schemes}
+
+        # Content lists fetched earlier in this refresh are kept, so a retry after a
+        # failure or preemption only fetches the schemes that are still missing
+        missing = [source for source in schemes if source not in self.source_contents]
+        results = await asyncio.gather(
+            *[self.get_content_list(schemes[source]) for source in missing],
+            return_exceptions=True,
+        )
+        exceptions = []
+        for source, result in zip(missing, results):
+            if isinstance(result, BaseException):
+                exceptions.append(result)
+            else:
+                self.source_contents[source] = result
+        if exceptions:
+            raise exceptions[0]
+
+        source_contents = []
+        for source in schemes:
+            source_contents.extend(self.source_contents[source])
+        return source_contents
+
+    async def get_source_list(self, scheme, valid_schemes):
+        response = await self.send_json(
+            endpoint="avContent",
+            method="getSourceList",
+            id=1,
+            params=[dict(scheme=scheme)],
+            version="1.0",
+            priority=PRIORITY_REFRESH,
+        )
+        return self.parse_source_list(response, valid_schemes)
+
+    async def get_sources(self):
+        source_contents, input_labels = await asyncio.gather(
+            self.get_source_contents(),
+            self.get_input_labels(),
+        )
+        return self.parse_sources(source_contents, input_labels)
+
+    async def get_system_info(self):
+        response = await self.send_json(
             endpoint="system",
             method="getSystemInformation",
             id=33,
             params=[],
             version="1.0",
+            priority=PRIORITY_POLL,
         )
-        if not response.get("error"):
-            system_info = response.get("result")[0]
-        return system_info
+        return self.parse_system_info(response)
 
-    def get_volume_info(self):
-        volume_info = {}
-        response = self.send_json(
+    async def get_volume_info(self):
+        response = await self.send_json(
             endpoint="audio",
             method="getVolumeInformation",
             id=33,
             params=[],
             version="1.0",
+            priority=PRIORITY_POLL,
         )
-        if not response.get("error"):
-            results = response.get("result")[0]
-            for result in results:
-                if result["target"] == "speaker":
-                    volume_info = result
-        return volume_info
-
-    def wake_on_lan(self, mac_address):
-        if mac_address:
-            addr_byte = mac_address.split(":")
-            hw_addr = struct.pack(
-                "BBBBBB",
-                int(addr_byte[0], 16),
-                int(addr_byte[1], 16),
-                int(addr_byte[2], 16),
-                int(addr_byte[3], 16),
-                int(addr_byte[4], 16),
-                int(addr_byte[5], 16),
-            )
-            msg = b"\xff" * 6 + hw_addr * 16
-            socket_instance = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            socket_instance.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            socket_instance.sendto(msg, ("<broadcast>", 9))
-            socket_instance.close()
+        return self.parse_volume_info(response)
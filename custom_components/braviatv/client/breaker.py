@@ -0,0 +1,42 @@
+"""Sony Bravia Client"""
+import random
+import time
+
+from .const import (
+    BREAKER_BACKOFF,
+    BREAKER_BACKOFF_MAX,
+    BREAKER_THRESHOLD,
+)
+
+
+class SonyBraviaCircuitBreaker(object):
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, backoff=BREAKER_BACKOFF, backoff_max=BREAKER_BACKOFF_MAX):
+        self.threshold = threshold
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.failures = 0
+        self.retry_timestamp = 0.0
+
+    @property
+    def is_open(self):
+        return bool(self.failures >= self.threshold)
+
+    @property
+    def retry_in(self):
+        return max(0.0, self.retry_timestamp - time.monotonic())
+
+    def allow(self):
+        return bool(not self.is_open or time.monotonic() >= self.retry_timestamp)
+
+    def record_success(self):
+        self.failures = 0
+        self.retry_timestamp = 0.0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.is_open:
+            exponent = min(self.failures - self.threshold, 16)
+            delay = min(self.backoff_max, self.backoff * 2 ** exponent)
+            # Full jitter keeps many unreachable TVs from probing in lockstep
+            self.retry_timestamp = time.monotonic() + random.uniform(delay / 2, delay)
@@ -1,4 +1,14 @@
 """Sony Bravia Client"""
+BREAKER_BACKOFF = 30
+BREAKER_BACKOFF_MAX = 600
+BREAKER_THRESHOLD = 3
+
+CONCURRENCY = 3
+
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_MAX_HOSTS = 1024
+DISCOVERY_TIMEOUT = 1.5
+
 IRCC_DATA = (
 """
 <s:Envelope
@@ -17,8 +27,35 @@ IRCC_HEADERS = {
     "SOAPACTION": '"urn:schemas-sony-com:service:IRCC:1#X_SendIRCC"',
 }
 
+IRCC_HOLD_INTERVAL = 0.2
+
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+METADATA = [
+    "apps",
+    "commands",
+    "input_labels",
+    "interface_info",
+    "source_contents",
+    "system_info",
+]
+
 MINIMUM_UPDATE_INTERVAL = 0
 
+POOL_SIZE = 3
+
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+PRIORITY_REFRESH = 2
+
+PROBE_TIMEOUT = 2
+
+RECORDER_BACKUPS = 2
+RECORDER_MAX_SIZE = 1048576
+RECORDER_QUEUE_SIZE = 64
+
+SLOW_TIER_TTL = 3600
+
 TIMEOUT = 10
 
 VALID_EXT_INPUT_SCHEMES = [
@@ -2,19 +2,108 @@
 from .const import VALID_TV_SCHEMES
 
 
-class SonyBraviaDevice(object):
+class SonyBraviaRecord(object):
+    __slots__ = ()
 
-    def __init__(self, client, data):
-        self.client = client
-        self.data = data
+    def __init__(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+class SonyBraviaInfo(SonyBraviaRecord):
+    __slots__ = ("interface_info", "system_info")
+
+    def __init__(self, interface_info, system_info):
+        super().__init__(interface_info=interface_info, system_info=system_info)
 
-    @property
-    def power_status(self):
-        return self.data.get("power_status")
 
-    @power_status.setter
-    def power_status(self, status):
-        self.client.send_json(
+class SonyBraviaMetadata(SonyBraviaRecord):
+    __slots__ = ("apps", "commands", "source_contents", "app_names", "command_names")
+
+    def __init__(self, apps, commands, source_contents):
+        super().__init__(
+            apps=apps,
+            commands=commands,
+            source_contents=source_contents,
+            app_names=sorted(apps),
+            command_names=sorted(commands),
+        )
+
+
+class SonyBraviaDevice(SonyBraviaRecord):
+    __slots__ = (
+        "client",
+        "info",
+        "metadata",
+        "power_status",
+        "volume_info",
+        "playing_info",
+        "playing_time",
+        "input_labels",
+        "sources",
+        "source_index",
+        "tv_input_active",
+    )
+
+    def __init__(self, client, info, metadata, power_status=None, volume_info=None, playing_info=None,
+                 playing_time=None, input_labels=None, sources=None, source_index=None):
+        playing_info = playing_info or {}
+        sources = sources or {}
+        if source_index is None:
+            source_index = {uri: name for name, uri in sources.items()}
+        super().__init__(
+            client=client,
+            info=info,
+            metadata=metadata,
+            power_status=power_status,
+            volume_info=volume_info or {},
+            playing_info=playing_info,
+            playing_time=playing_time or {},
+            input_labels=input_labels or {},
+            sources=sources,
+            source_index=source_index,
+            tv_input_active=bool(playing_info.get("source") in VALID_TV_SCHEMES),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, SonyBraviaDevice):
+            return NotImplemented
+        # Static tiers are shared by reference, only the fast tier needs comparing
+        return bool(
+            self.info is other.info
+            and self.metadata is other.metadata
+            and self.power_status == other.power_status
+            and self.volume_info == other.volume_info
+            and self.playing_info == other.playing_info
+            and self.input_labels == other.input_labels
+        )
+
+    def __hash__(self):
+        return hash((id(self.info), id(self.metadata), self.power_status))
+
+    def as_dict(self):
+        return dict(
+            power_status=self.power_status,
+            interface_info=self.info.interface_info,
+            system_info=self.info.system_info,
+            apps=self.apps,
+            commands=self.commands,
+            source_contents=self.metadata.source_contents,
+            input_labels=self.input_labels,
+            sources=self.sources,
+            volume_info=self.volume_info,
+            playing_info=self.playing_info,
+            playing_time=self.playing_time,
+        )
+
+    def set_power_status(self, status):
+        return self.client.send_json(
             endpoint="system",
             method="setPowerStatus",
             id=55,
@@ -32,77 +121,73 @@ class SonyBraviaDevice(object):
 
     @property
     def product_category(self):
-        return self.data.get("interface_info", {}).get("productCategory")
+        return self.info.interface_info.get("productCategory")
 
     @property
     def product_name(self):
-        return self.data.get("interface_info", {}).get("productName")
+        return self.info.interface_info.get("productName")
 
     @property
     def model_name(self):
-        return self.data.get("interface_info", {}).get("modelName")
+        return self.info.interface_info.get("modelName")
 
     @property
     def interface_version(self):
-        return self.data.get("interface_info", {}).get("interfaceVersion")
+        return self.info.interface_info.get("interfaceVersion")
 
     @property
     def model(self):
-        return self.data.get("system_info", {}).get("model")
+        return self.info.system_info.get("model")
 
     @property
     def name(self):
-        return self.data.get("system_info", {}).get("name")
+        return self.info.system_info.get("name")
 
     @property
     def serial(self):
-        return self.data.get("system_info", {}).get("serial")
+        return self.info.system_info.get("serial")
 
     @property
     def mac_address(self):
-        return self.data.get("system_info", {}).get("macAddr")
+        return self.info.system_info.get("macAddr")
 
     @property
     def generation(self):
-        return self.data.get("system_info", {}).get("generation")
+        return self.info.system_info.get("generation")
 
     @property
     def cid(self):
-        return self.data.get("system_info", {}).get("cid")
+        return self.info.system_info.get("cid")
 
     @property
     def apps(self):
-        return self.data.get("apps", {})
+        return self.metadata.apps
 
     @property
     def commands(self):
-        return self.data.get("commands", {})
+        return self.metadata.commands
 
     @property
-    def sources(self):
-        return self.data.get("sources", {})
+    def app_names(self):
+        return self.metadata.app_names
+
+    @property
+    def command_names(self):
+        return self.metadata.command_names
 
     @property
     def volume(self):
-        return self.data.get("volume_info", {}).get("volume")
+        return self.volume_info.get("volume")
 
-    @volume.setter
-    def volume(self, volume):
-        self.client.send_json(
-            endpoint="audio",
-            method="setAudioVolume",
-            id=98,
-            params=[dict(target="speaker", volume=volume, ui="on")],
-            version="1.2",
-        )
+    def set_volume(self, volume):
+        return self.client.set_volume(volume)
 
     @property
     def mute(self):
-        return bool(self.data.get("volume_info", {}).get("mute"))
+        return bool(self.volume_info.get("mute"))
 
-    @mute.setter
-    def mute(self, mute):
-        self.client.send_json(
+    def set_mute(self, mute):
+        return self.client.send_json(
             endpoint="audio",
             method="setAudioMute",
             id=601,
@@ -112,34 +197,35 @@ class SonyBraviaDevice(object):
 
     @property
     def source(self):
-        return self.data.get("playing_info", {}).get("source")
+        return self.playing_info.get("source")
 
     @property
-    def tv_input_active(self):
-        return bool(self.source in VALID_TV_SCHEMES)
+    def source_name(self):
+        # The labelled name of the playing input or channel, as listed in sources
+        return self.source_index.get(self.playing_info.get("uri"))
 
     @property
     def title(self):
-        return self.data.get("playing_info", {}).get("title")
+        return self.playing_info.get("title")
 
     @property
     def display_number(self):
-        return self.data.get("playing_info", {}).get("dispNum")
+        return self.playing_info.get("dispNum")
 
     @property
     def program_title(self):
-        return self.data.get("playing_info", {}).get("programTitle")
+        return self.playing_info.get("programTitle")
 
     @property
     def start_time(self):
-        return self.data.get("playing_time", {}).get("start_time")
+        return self.playing_time.get("start_time")
 
     @property
     def end_time(self):
-        return self.data.get("playing_time", {}).get("end_time")
+        return self.playing_time.get("end_time")
 
     def set_active_app(self, uri):
-        self.client.send_json(
+        return self.client.send_json(
             endpoint="appControl",
             method="setActiveApp",
             id=601,
@@ -148,7 +234,7 @@ class SonyBraviaDevice(object):
         )
 
     def set_play_content(self, uri):
-        self.client.send_json(
+        return self.client.send_json(
             endpoint="avContent",
             method="setPlayContent",
             id=101,
@@ -157,7 +243,10 @@ class SonyBraviaDevice(object):
         )
 
     def send_command(self, command):
-        self.client.send_ircc(command)
+        return self.client.send_ircc(command)
+
+    def send_command_sequence(self, commands, repeats=1, delay=0.0, hold=0.0):
+        return self.client.send_ircc_sequence(commands, repeats, delay, hold)
 
     def wake_on_lan(self):
         self.client.wake_on_lan(self.mac_address)
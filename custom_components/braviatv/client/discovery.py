@@ -0,0 +1,71 @@
+"""Sony Bravia Client"""
+import aiohttp
+import asyncio
+import ipaddress
+import json
+
+from .const import (
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_TIMEOUT,
+)
+
+PROBE_DATA = json.dumps(dict(method="getInterfaceInformation", id=33, params=[], version="1.0")).encode("UTF-8")
+
+
+class SonyBraviaDiscovery(object):
+
+    def __init__(self, session=None, concurrency=DISCOVERY_CONCURRENCY, timeout=DISCOVERY_TIMEOUT):
+        self.session = session
+        self.owns_session = bool(session is None)
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.timeout = timeout
+
+    @staticmethod
+    def get_hosts(network, max_hosts=DISCOVERY_MAX_HOSTS):
+        network = ipaddress.ip_network(network, strict=False)
+        if network.num_addresses > max_hosts + 2:
+            raise ValueError(f"Network too large: {network}, at most {max_hosts} hosts can be scanned")
+        if network.num_addresses == 1:
+            return [str(network.network_address)]
+        return [str(host) for host in network.hosts()]
+
+    def get_session(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+        return self.session
+
+    async def close(self):
+        if self.owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def probe(self, host):
+        # getInterfaceInformation answers without a PSK, anything else on the network fails fast
+        async with self.semaphore:
+            try:
+                async with self.get_session().post(
+                    f"http://{host}/sony/system",
+                    data=PROBE_DATA,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                ) as response:
+                    content = await response.read()
+                response = json.loads(content.decode("utf-8"))
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                return None
+        # Other devices may answer with any JSON, only a BRAVIA result list is accepted
+        if not isinstance(response, dict) or not isinstance(response.get("result"), list) or not response["result"]:
+            return None
+        interface_info = response["result"][0]
+        if not isinstance(interface_info, dict) or interface_info.get("productCategory") != "tv":
+            return None
+        return dict(
+            host=host,
+            product_name=interface_info.get("productName"),
+            model_name=interface_info.get("modelName"),
+            interface_info=interface_info,
+        )
+
+    async def scan(self, hosts):
+        results = await asyncio.gather(*[self.probe(host) for host in hosts])
+        return [result for result in results if result is not None]
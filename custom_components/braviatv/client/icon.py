@@ -0,0 +1,17 @@
+"""Sony Bravia Client"""
+import aiohttp
+
+
+async def read_icon(session, url, max_size, timeout):
+    # The whole body is read, a single read only returns what is buffered so far
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+        if response.status != 200 or (response.content_length or 0) > max_size:
+            return None
+        content = bytearray()
+        async for chunk in response.content.iter_any():
+            content.extend(chunk)
+            if len(content) > max_size:
+                return None
+    if not content or (response.content_length is not None and len(content) < response.content_length):
+        return None
+    return bytes(content)
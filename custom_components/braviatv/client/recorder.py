@@ -0,0 +1,73 @@
+"""Sony Bravia Client"""
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+
+from .const import (
+    RECORDER_BACKUPS,
+    RECORDER_MAX_SIZE,
+    RECORDER_QUEUE_SIZE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SonyBraviaRecorder(object):
+
+    def __init__(self, location, max_size=RECORDER_MAX_SIZE, backups=RECORDER_BACKUPS, queue_size=RECORDER_QUEUE_SIZE):
+        self.location = location
+        self.max_size = max_size
+        self.backups = backups
+        self.hashes = {}
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.thread = None
+
+    def record(self, response, name="response"):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name=f"braviatv-recorder-{os.path.basename(self.location)}", daemon=True)
+            self.thread.start()
+        try:
+            self.queue.put_nowait((name, response))
+        except queue.Full:
+            _LOGGER.debug("Recorder queue is full, dropping response: %s", name)
+
+    def close(self):
+        if self.thread is not None:
+            try:
+                self.queue.put_nowait((None, None))
+            except queue.Full:
+                pass
+            self.thread = None
+
+    def run(self):
+        while True:
+            name, response = self.queue.get()
+            if name is None:
+                return
+            try:
+                self.write(response, name)
+            except Exception as exception_instance:
+                _LOGGER.debug("Unable to save response: %s, %s", name, exception_instance)
+
+    def write(self, response, name):
+        content = json.dumps(response, default=lambda o: "not-serializable", indent=4, sort_keys=True)
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        if self.hashes.get(name) == digest:
+            return
+        if len(content) > self.max_size:
+            _LOGGER.debug("Response exceeds %s bytes, not saving: %s", self.max_size, name)
+            return
+
+        os.makedirs(self.location, exist_ok=True)
+        path = f"{self.location}/{name.replace('/', '_').replace('.', '_')}"
+        for index in range(self.backups, 0, -1):
+            source = f"{path}.{index - 1}.json" if index > 1 else f"{path}.json"
+            if os.path.isfile(source):
+                os.replace(source, f"{path}.{index}.json")
+        with open(f"{path}.tmp", "w") as file:
+            file.write(content)
+        os.replace(f"{path}.tmp", f"{path}.json")
+        self.hashes[name] = digest
@@ -0,0 +1,82 @@
+"""Sony Bravia Client"""
+import asyncio
+import heapq
+import itertools
+
+from .const import (
+    CONCURRENCY,
+    PRIORITY_COMMAND,
+)
+
+
+class SonyBraviaScheduler(object):
+
+    def __init__(self, concurrency=CONCURRENCY):
+        self.concurrency = concurrency
+        self.active = {}
+        self.started = set()
+        self.preempted = set()
+        self.revoked = set()
+        self.waiters = []
+        self.sequence = itertools.count()
+
+    @property
+    def pending(self):
+        return sum(1 for waiter in self.waiters if not waiter[2].done())
+
+    async def acquire(self, priority):
+        task = asyncio.current_task()
+        if len(self.active) < self.concurrency and not self.pending:
+            self.active[task] = priority
+            self.started.add(task)
+            return
+        sequence = next(self.sequence)
+        while True:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self.waiters, (priority, sequence, future, task))
+            if priority == PRIORITY_COMMAND:
+                self.preempt(priority)
+            try:
+                await future
+            except asyncio.CancelledError:
+                self.revoked.discard(task)
+                if task in self.active:
+                    self.release(task)
+                else:
+                    future.cancel()
+                raise
+            if task not in self.revoked:
+                break
+            # The slot was handed to a command before this task resumed, queue again in the same place
+            self.revoked.discard(task)
+        self.started.add(task)
+
+    def release(self, task):
+        self.active.pop(task, None)
+        self.started.discard(task)
+        self.preempted.discard(task)
+        while self.waiters and len(self.active) < self.concurrency:
+            priority, _, future, waiter = heapq.heappop(self.waiters)
+            if not future.done():
+                self.active[waiter] = priority
+                future.set_result(None)
+
+    def preempt(self, priority):
+        # Make room for the waiting request by taking the slot of the least important one
+        candidates = [
+            (active_priority, task) for task, active_priority in self.active.items()
+            if active_priority > priority and task not in self.preempted
+        ]
+        if candidates:
+            _, task = max(candidates, key=lambda candidate: candidate[0])
+            if task in self.started:
+                # Running a request, cancelling it ends only that request
+                self.preempted.add(task)
+                task.cancel()
+            else:
+                # Granted a slot but not resumed yet, it gives the slot back without being cancelled
+                self.revoked.add(task)
+                self.release(task)
+
+    def was_preempted(self, task):
+        return bool(task in self.preempted)
@@ -0,0 +1,68 @@
+"""Sony Bravia Client"""
+import bisect
+import collections
+
+from .const import LATENCY_BUCKETS
+
+
+class SonyBraviaEndpointStats(object):
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = collections.Counter()
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_max = 0.0
+        self.latency_total = 0.0
+        self.bytes = 0
+
+    @property
+    def latency_mean(self):
+        return self.latency_total / self.calls if self.calls else 0.0
+
+    def record(self, latency, size=0, error=None):
+        self.calls += 1
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.latency_max = max(self.latency_max, latency)
+        self.latency_total += latency
+        self.bytes += size
+        if error is not None:
+            self.errors[error] += 1
+
+    def as_dict(self):
+        buckets = [f"<={bucket}s" for bucket in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+        return dict(
+            calls=self.calls,
+            errors=dict(self.errors),
+            latency_mean=round(self.latency_mean, 4),
+            latency_max=round(self.latency_max, 4),
+            latency_histogram=dict(zip(buckets, self.histogram)),
+            bytes=self.bytes,
+        )
+
+
+class SonyBraviaStats(object):
+
+    def __init__(self):
+        self.endpoints = collections.defaultdict(SonyBraviaEndpointStats)
+
+    @property
+    def calls(self):
+        return sum(stats.calls for stats in self.endpoints.values())
+
+    @property
+    def bytes(self):
+        return sum(stats.bytes for stats in self.endpoints.values())
+
+    @property
+    def latency_mean(self):
+        calls = self.calls
+        return sum(stats.latency_total for stats in self.endpoints.values()) / calls if calls else 0.0
+
+    def record(self, endpoint, method, latency, size=0, error=None):
+        self.endpoints[f"{endpoint}/{method}"].record(latency, size, error)
+
+    def record_error(self, endpoint, method, error):
+        self.endpoints[f"{endpoint}/{method}"].errors[error] += 1
+
+    def as_dict(self):
+        return {name: stats.as_dict() for name, stats in sorted(self.endpoints.items())}
@@ -1,19 +1,24 @@
 """Config flow for the badnest component."""
 import logging
+from urllib.parse import urlparse
 
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.components import network, ssdp
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_SCAN_INTERVAL
 from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 
-from .client import SonyBraviaClient
+from .client import AsyncSonyBraviaClient
+from .client.discovery import SonyBraviaDiscovery
 from .const import (
     CONF_12H,
     CONF_24H,
     CONF_EXT_SPEAKER,
     CONF_HIDDEN,
+    CONF_NETWORK,
     CONF_PSK,
     CONF_SAVE_RESPONSES,
     CONF_SOURCE,
@@ -32,6 +37,7 @@ from .const import (
     VALUES_TIMEOUT,
     DATA_COORDINATOR,
 )
+from .hub import async_get_hub
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,21 +51,90 @@ class SonyBraviaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         """Initialize config flow."""
         self.client = None
+        self.device = None
+        self.discovered = {}
+        self.host = None
         self.index = 0
         self.user_input = {}
 
     async def async_connect(self, host, psk):
         """Return true if the given username and password are valid."""
-        self.client = SonyBraviaClient(host, psk)
-        system_info = await self.hass.async_add_executor_job(self.client.get_system_info)
-        if system_info:
-            name, model = system_info.get("name"), system_info.get("model")
-            self.user_input[CONF_TITLE] = f"{name} {model} ({host})"
+        self.client = AsyncSonyBraviaClient(host, psk, session=async_get_clientsession(self.hass))
+        # Fetch everything the entry needs at once, the new entry's client starts from it
+        self.device = await self.client.prefetch()
+        if self.device.serial:
+            self.user_input[CONF_TITLE] = f"{self.device.name} {self.device.model} ({host})"
             return True
         return False
 
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["discovery", "manual"])
+
+    async def async_step_ssdp(self, discovery_info: ssdp.SsdpServiceInfo):
+        """Handle a TV announced over SSDP."""
+        host = urlparse(discovery_info.ssdp_location).hostname
+        await self.async_set_unique_id(host)
+        self._abort_if_unique_id_configured()
+        # The announcement also matches Sony soundbars, receivers and cameras
+        discovery = SonyBraviaDiscovery(session=async_get_clientsession(self.hass))
+        if await discovery.probe(host) is None:
+            return self.async_abort(reason="not_bravia_device")
+        self.host = host
+        self.context["title_placeholders"] = {
+            CONF_NAME: discovery_info.upnp.get(ssdp.ATTR_UPNP_FRIENDLY_NAME, host),
+        }
+        return await self.async_step_manual()
+
+    async def async_step_discovery(self, user_input=None):
+        """Scan a network for TVs."""
+        errors = {}
+
+        if user_input is not None:
+            try:
+                hosts = SonyBraviaDiscovery.get_hosts(user_input[CONF_NETWORK])
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                discovery = SonyBraviaDiscovery(session=async_get_clientsession(self.hass))
+                configured = self._async_current_ids()
+                self.discovered = {
+                    result[CONF_HOST]: f"{result['product_name']} {result['model_name']} ({result[CONF_HOST]})"
+                    for result in await discovery.scan(hosts)
+                    if result[CONF_HOST] not in configured
+                }
+                if self.discovered:
+                    return await self.async_step_select()
+                errors["base"] = "no_devices"
+
+        source_ip = await network.async_get_source_ip(self.hass)
+        return self.async_show_form(
+            step_id="discovery",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_NETWORK, default=f"{source_ip}/24"): cv.string,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_select(self, user_input=None):
+        """Pick one of the TVs that were found."""
+        if user_input is not None:
+            self.host = user_input[CONF_HOST]
+            return await self.async_step_manual()
+
+        return self.async_show_form(
+            step_id="select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): vol.In(self.discovered),
+                }
+            ),
+        )
+
+    async def async_step_manual(self, user_input=None):
+        """Connect to a TV by its host and PSK."""
         errors = {}
 
         if user_input is not None:
@@ -71,19 +146,16 @@ class SonyBraviaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self.user_input[CONF_PSK] = user_input[CONF_PSK]
                 self.user_input[CONF_EXT_SPEAKER] = user_input[CONF_EXT_SPEAKER]
                 self.user_input[CONF_TIME_FORMAT] = user_input[CONF_TIME_FORMAT]
-                power_status = await self.hass.async_add_executor_job(self.client.get_power_status)
-                if power_status == "active":
+                if self.device.is_on:
                     return await self.async_step_source_list()
-                return self.async_create_entry(
-                    title=self.user_input[CONF_TITLE], data=self.user_input
-                )
+                return await self.async_create_prefetched_entry()
             errors["base"] = "no_connect"
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_HOST): cv.string,
+                    vol.Required(CONF_HOST, default=self.host or vol.UNDEFINED): cv.string,
                     vol.Required(CONF_PSK): cv.string,
                     vol.Required(CONF_EXT_SPEAKER, default=DEFAULT_EXT_SPEAKER): cv.boolean,
                     vol.Required(CONF_TIME_FORMAT, default=DEFAULT_TIME_FORMAT): vol.In([CONF_12H, CONF_24H]),
@@ -97,8 +169,7 @@ class SonyBraviaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.user_input[CONF_SOURCE_LIST] = user_input[CONF_SOURCE_LIST]
             return await self.async_step_source_config()
 
-        sources = await self.hass.async_add_executor_job(self.client.get_sources)
-        source_names = list(sources.keys())
+        source_names = list(self.device.sources.keys())
 
         return self.async_show_form(
             step_id="source_list",
@@ -121,7 +192,7 @@ class SonyBraviaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if self.index == len(self.user_input[CONF_SOURCE_LIST]):
             self.index = 0
-            return self.async_create_entry(title=self.user_input[CONF_TITLE], data=self.user_input)
+            return await self.async_create_prefetched_entry()
         elif self.index == 0:
             self.user_input[CONF_SOURCE_CONFIG] = []
 
@@ -137,6 +208,13 @@ class SonyBraviaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders={"source": source},
         )
 
+    async def async_create_prefetched_entry(self):
+        """Create the entry and hand the prefetched data to its client."""
+        hub = async_get_hub(self.hass)
+        await hub.async_load()
+        hub.prefetched[self.client.host] = self.client.export()
+        return self.async_create_entry(title=self.user_input[CONF_TITLE], data=self.user_input)
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -3,16 +3,23 @@ ATTR_APP = "app"
 ATTR_APP_LIST = "app_list"
 ATTR_COMMAND = "command"
 ATTR_COMMAND_LIST = "command_list"
+ATTR_ENDPOINTS = "endpoints"
+ATTR_ERROR = "error"
 ATTR_HOST = "host"
 ATTR_NAME = "name"
+ATTR_POLL_MODE = "poll_mode"
+ATTR_SUCCESS = "success"
 
+DATA_CLIENT = "client"
 DATA_COORDINATOR = "coordinator"
+DATA_HUB = "hub"
 
 CONF_12H = "12H"
 CONF_24H = "24H"
 CONF_ENTRY_INDEX = "index"
 CONF_EXT_SPEAKER = "ext_speaker"
 CONF_HIDDEN = "hidden"
+CONF_NETWORK = "network"
 CONF_PSK = "psk"
 CONF_SOURCE = "source"
 CONF_SOURCE_CONFIG = "source_config"
@@ -26,7 +33,12 @@ DOMAIN = "braviatv"
 
 MANUFACTURER = "Sony"
 
+POLL_MODE_FAST = "fast"
+POLL_MODE_SLOW = "slow"
+POLL_MODE_STANDBY = "standby"
+
 SERVICE_OPEN_APP = "open_app"
+SERVICE_REFRESH_METADATA = "refresh_metadata"
 SERVICE_SEND_COMMAND = "send_command"
 
 SOURCE_APP = "App"
@@ -46,4 +58,24 @@ DEFAULT_SCAN_INTERVAL = VALUES_SCAN_INTERVAL[0]
 DEFAULT_TIME_FORMAT = CONF_24H
 DEFAULT_TIMEOUT = VALUES_TIMEOUT[1]
 
+BOOST_PERIOD = 30
+CONFIRM_DELAY_POWER = 5
+HUB_CONCURRENCY = 8
+PHASE_STEP = 0.6180339887
+SERVICE_TIMEOUT = 10
+SCAN_INTERVAL_FAST = 10
+SCAN_INTERVAL_STANDBY = 300
+STABLE_PERIOD = 120
+
+ICON_CACHE_DIR = "icons"
+ICON_CONCURRENCY = 2
+ICON_DISK_SIZE = 16777216
+ICON_MAX_SIZE = 262144
+ICON_MEMORY_SIZE = 4194304
+ICON_TIMEOUT = 10
+
+STORAGE_KEY = f"{DOMAIN}.metadata"
+STORAGE_SAVE_DELAY = 30
+STORAGE_VERSION = 1
+
 UNDO_UPDATE_LISTENER = "undo_update_listener"
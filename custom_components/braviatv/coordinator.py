@@ -0,0 +1,165 @@
+"""Data update coordinator for a Sony Bravia TV."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from functools import partial
+import async_timeout
+import logging
+import time
+
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .client import AsyncSonyBraviaClient, SonyBraviaException
+from .client.device import SonyBraviaDevice
+from .const import (
+    BOOST_PERIOD,
+    CONFIRM_DELAY_POWER,
+    POLL_MODE_FAST,
+    POLL_MODE_SLOW,
+    POLL_MODE_STANDBY,
+    SCAN_INTERVAL_FAST,
+    SCAN_INTERVAL_STANDBY,
+    STABLE_PERIOD,
+)
+from .hub import SonyBraviaHub
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SonyBraviaCoordinator(DataUpdateCoordinator[SonyBraviaDevice]):
+    """Poll a Sony BRAVIA device at an interval that follows its state."""
+
+    def __init__(self, hass: HomeAssistant, client: AsyncSonyBraviaClient, scan_interval: int, timeout: int, hub: SonyBraviaHub) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass=hass,
+            logger=_LOGGER,
+            name=f"Sony BRAVIA ({client.host})",
+            update_interval=timedelta(seconds=min(SCAN_INTERVAL_FAST, scan_interval)),
+            always_update=False,
+        )
+        self.client = client
+        self.timeout = timeout
+        self.hub = hub
+        self.phase = hub.next_phase()
+        self.icons_metadata = None
+        self.poll_intervals = {
+            POLL_MODE_FAST: min(SCAN_INTERVAL_FAST, scan_interval),
+            POLL_MODE_SLOW: scan_interval,
+            POLL_MODE_STANDBY: max(SCAN_INTERVAL_STANDBY, scan_interval),
+        }
+        self.poll_mode = POLL_MODE_FAST
+        self.boost_timestamp = 0.0
+        self.change_timestamp = time.monotonic()
+        self.apply_count = 0
+        self.confirm_delays = {"power_status": CONFIRM_DELAY_POWER}
+        self.unsub_confirm: dict[str, Callable[[], None]] = {}
+
+    async def _async_update_data(self) -> SonyBraviaDevice:
+        """Fetch data from API endpoint."""
+        try:
+            async with async_timeout.timeout(self.timeout):
+                device = await self.client.update()
+        except SonyBraviaException as exception:
+            raise UpdateFailed(f"Error communicating with API: {exception}")
+
+        self._update_poll_mode(device)
+        self.hub.async_save_metadata()
+        if device.is_on and device.metadata is not self.icons_metadata:
+            # The TV only serves icons while it is on
+            self.icons_metadata = device.metadata
+            self.hub.icons.async_prefetch(app["icon"] for app in device.apps.values() if app.get("icon"))
+        return device
+
+    def _update_poll_mode(self, device: SonyBraviaDevice) -> None:
+        """Pick the poll interval for the next update."""
+        now = time.monotonic()
+        if device != self.data:
+            self.change_timestamp = now
+
+        if now < self.boost_timestamp:
+            poll_mode = POLL_MODE_FAST
+        elif not device.is_on:
+            poll_mode = POLL_MODE_STANDBY
+        elif now - self.change_timestamp < STABLE_PERIOD:
+            poll_mode = POLL_MODE_FAST
+        else:
+            poll_mode = POLL_MODE_SLOW
+
+        # Polls land on this TV's phase of the interval so several TVs do not poll at once
+        self.update_interval = timedelta(seconds=self.hub.next_delay(self.phase, self.poll_intervals[poll_mode]))
+        if poll_mode != self.poll_mode:
+            _LOGGER.debug("%s: switching to %s polling", self.name, poll_mode)
+            self.poll_mode = poll_mode
+            # Unchanged data does not notify listeners, the diagnostic sensor still needs the new interval
+            self.async_update_listeners()
+
+    @property
+    def poll_interval(self) -> int:
+        """Return the poll interval of the current mode."""
+        return self.poll_intervals[self.poll_mode]
+
+    async def async_boost(self) -> None:
+        """Poll fast for a while after a user command."""
+        self.boost_timestamp = time.monotonic() + BOOST_PERIOD
+        # Commands return without waiting for the refresh they trigger
+        self.hass.async_create_background_task(self.async_request_refresh(), f"{self.name} boost")
+
+    @callback
+    def async_apply(self, **values) -> None:
+        """Show the expected result of an action until the TV confirms it."""
+        self.apply_count += 1
+        for key in values:
+            if unsub := self.unsub_confirm.pop(key, None):
+                unsub()
+        self.boost_timestamp = time.monotonic() + BOOST_PERIOD
+        device = self.client.apply(**values)
+        self._update_poll_mode(device)
+        self.async_set_updated_data(device)
+
+    @callback
+    def async_schedule_confirm(self, *keys: str) -> None:
+        """Read fields back once the TV had time to act, later actions restart the wait."""
+        for key in keys:
+            if unsub := self.unsub_confirm.pop(key, None):
+                unsub()
+            self.unsub_confirm[key] = async_call_later(
+                self.hass,
+                self.confirm_delays.get(key, 0),
+                HassJob(partial(self._async_confirm_later, key), cancel_on_shutdown=True),
+            )
+
+    async def _async_confirm_later(self, key: str, _now: datetime) -> None:
+        """Confirm a field once its delay has passed."""
+        self.unsub_confirm.pop(key, None)
+        await self.async_confirm(key)
+
+    async def async_confirm(self, *keys: str) -> None:
+        """Fetch only the given fields instead of running a full update."""
+        apply_count = self.apply_count
+        try:
+            async with async_timeout.timeout(self.timeout):
+                device = await self.client.confirm(*keys)
+        except SonyBraviaException as exception:
+            _LOGGER.debug("%s: confirming %s failed, refreshing instead: %s", self.name, ", ".join(keys), exception)
+            await self.async_request_refresh()
+            return
+
+        if apply_count != self.apply_count:
+            # A newer action was applied meanwhile and schedules its own confirmation
+            return
+        self._update_poll_mode(device)
+        self.async_set_updated_data(device)
+
+    @callback
+    def async_cancel_confirm(self) -> None:
+        """Cancel pending confirmations."""
+        for unsub in self.unsub_confirm.values():
+            unsub()
+        self.unsub_confirm.clear()
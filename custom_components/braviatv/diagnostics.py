@@ -0,0 +1,45 @@
+"""Diagnostics support for a Sony Bravia TV."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_PSK,
+    DATA_CLIENT,
+    DATA_COORDINATOR,
+    DOMAIN,
+)
+
+TO_REDACT = {CONF_PSK, "cid", "macAddr", "serial"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry = hass.data[DOMAIN][config_entry.entry_id]
+    client = entry[DATA_CLIENT]
+    coordinator = entry[DATA_COORDINATOR]
+
+    return {
+        "entry": {
+            "data": async_redact_data(config_entry.data, TO_REDACT),
+            "options": dict(config_entry.options),
+        },
+        "polling": {
+            "mode": coordinator.poll_mode,
+            "interval": coordinator.poll_interval,
+            "phase": round(coordinator.phase, 3),
+            "last_update_success": coordinator.last_update_success,
+        },
+        "breaker": {
+            "open": client.breaker.is_open,
+            "failures": client.breaker.failures,
+            "retry_in": round(client.breaker.retry_in, 1),
+        },
+        "requests": client.stats.as_dict(),
+        "hub": coordinator.hub.as_dict(),
+        "data": async_redact_data(coordinator.data.as_dict() if coordinator.data else {}, TO_REDACT),
+    }
@@ -0,0 +1,179 @@
+"""Resources shared by every Sony Bravia TV."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .client import AsyncSonyBraviaClient
+from .client.const import POOL_SIZE
+from .const import (
+    DATA_HUB,
+    DOMAIN,
+    HUB_CONCURRENCY,
+    PHASE_STEP,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+)
+from .icons import SonyBraviaIconCache
+
+if TYPE_CHECKING:
+    from . import SonyBraviaEntity
+    from .client.device import SonyBraviaDevice
+
+
+class SonyBraviaHub:
+    """Own the connection pool and poll limit of every TV, and spread their polls."""
+
+    def __init__(self, hass: HomeAssistant, concurrency: int = HUB_CONCURRENCY) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self.concurrency = concurrency
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.session: aiohttp.ClientSession | None = None
+        self.clients: dict[str, AsyncSonyBraviaClient] = {}
+        self.entities: dict[str, SonyBraviaEntity] = {}
+        self.epoch = time.monotonic()
+        self.phase_count = 0
+        self.store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self.stored: dict[str, Any] | None = None
+        self.saved: dict[str, tuple[Any, Any, Any]] = {}
+        self.prefetched: dict[str, dict[str, Any]] = {}
+        self.icons = SonyBraviaIconCache(hass, self.get_session)
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Return the session shared by every client."""
+        if self.session is None:
+            # Polls are bounded by the semaphore, a pool wide limit would queue commands behind them
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=0, limit_per_host=POOL_SIZE),
+            )
+        return self.session
+
+    def create_client(self, entry_id: str, host: str, psk: str, save_location: str | None = None) -> AsyncSonyBraviaClient:
+        """Create a client that uses the shared session and poll limit."""
+        client = AsyncSonyBraviaClient(
+            host=host,
+            psk=psk,
+            save_location=save_location,
+            session=self.get_session(),
+            limiter=self.semaphore,
+        )
+        self.clients[entry_id] = client
+        if metadata := self.prefetched.pop(host, None):
+            # Fetched by the config flow moments ago, saved once the first poll confirms it
+            client.restore(metadata, expired=False)
+        elif metadata := self.get_metadata(entry_id):
+            self.saved[entry_id] = self.get_version(client.restore(metadata))
+        return client
+
+    async def async_remove_client(self, entry_id: str) -> None:
+        """Close the client of an entry."""
+        if client := self.clients.pop(entry_id, None):
+            self._store_client(entry_id, client)
+            await client.close()
+
+    async def async_load(self) -> None:
+        """Load the metadata saved for every TV."""
+        if self.stored is None:
+            self.stored = await self.store.async_load() or {"devices": {}, "entries": {}}
+
+    def get_metadata(self, entry_id: str) -> dict[str, Any] | None:
+        """Return the metadata saved for the TV of an entry, by its serial."""
+        serial = self.stored["entries"].get(entry_id)
+        return self.stored["devices"].get(serial)
+
+    @staticmethod
+    def get_version(device: SonyBraviaDevice) -> tuple[Any, Any, Any]:
+        """Return the records that change when the metadata of a TV changes."""
+        # Input labels are fetched on every poll, they are compared by value
+        return device.info, device.metadata, device.input_labels
+
+    @callback
+    def async_save_metadata(self) -> None:
+        """Save the metadata of every TV, once it changed."""
+        changed = False
+        for entry_id, client in self.clients.items():
+            if client.device is not None and client.device.serial:
+                version = self.get_version(client.device)
+                if self.saved.get(entry_id) != version:
+                    self.saved[entry_id] = version
+                    changed = True
+        if changed:
+            self.store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    async def async_remove_metadata(self, entry_id: str) -> None:
+        """Forget the TV of a removed entry, and its metadata once no entry uses it."""
+        self.saved.pop(entry_id, None)
+        serial = self.stored["entries"].pop(entry_id, None)
+        if serial is None:
+            return
+        if serial not in self.stored["entries"].values():
+            self.stored["devices"].pop(serial, None)
+        await self.store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the metadata to save, keeping TVs that are not loaded."""
+        for entry_id, client in self.clients.items():
+            self._store_client(entry_id, client)
+        return self.stored
+
+    def _store_client(self, entry_id: str, client: AsyncSonyBraviaClient) -> None:
+        """Copy the metadata of a client into the data to save."""
+        if self.stored is not None and client.device is not None and client.device.serial:
+            self.stored["entries"][entry_id] = client.device.serial
+            self.stored["devices"][client.device.serial] = client.export()
+
+    def next_phase(self) -> float:
+        """Return the poll phase of the next TV as a fraction of its interval."""
+        # Golden ratio steps stay evenly spread however many TVs get added
+        phase = (self.phase_count * PHASE_STEP) % 1
+        self.phase_count += 1
+        return phase
+
+    def next_delay(self, phase: float, interval: float) -> float:
+        """Return the delay until the next poll slot of a TV."""
+        elapsed = (time.monotonic() - self.epoch - phase * interval) % interval
+        delay = interval - elapsed
+        # Slots that are too close are skipped instead of polling twice in a row
+        if delay < interval / 2:
+            delay += interval
+        return delay
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the aggregate throughput of every TV."""
+        uptime = max(time.monotonic() - self.epoch, 1.0)
+        calls = sum(client.stats.calls for client in self.clients.values())
+        size = sum(client.stats.bytes for client in self.clients.values())
+        return {
+            "clients": len(self.clients),
+            "concurrency": self.concurrency,
+            "calls": calls,
+            "bytes": size,
+            "calls_per_second": round(calls / uptime, 3),
+            "bytes_per_second": round(size / uptime, 1),
+        }
+
+    async def async_close(self) -> None:
+        """Save pending metadata and close the shared session."""
+        if self.stored is not None:
+            # A delayed save of a closed hub would overwrite what the next hub saves
+            await self.store.async_save(self._data_to_save())
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+def async_get_hub(hass: HomeAssistant) -> SonyBraviaHub:
+    """Return the hub, creating it for the first TV."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_HUB not in domain_data:
+        domain_data[DATA_HUB] = SonyBraviaHub(hass)
+    return domain_data[DATA_HUB]
@@ -0,0 +1,192 @@
+"""Cache for the app icons of Sony Bravia TVs."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterable
+import hashlib
+import logging
+import os
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+
+from .client.icon import read_icon
+from .const import (
+    DOMAIN,
+    ICON_CACHE_DIR,
+    ICON_CONCURRENCY,
+    ICON_DISK_SIZE,
+    ICON_MAX_SIZE,
+    ICON_MEMORY_SIZE,
+    ICON_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def get_content_type(content: bytes) -> str:
+    """Return the content type of an icon from its first bytes."""
+    if content.startswith(b"\xff\xd8"):
+        return "image/jpeg"
+    if content.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if content.startswith(b"RIFF") and content[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/png"
+
+
+def get_key(url: str) -> str:
+    """Return the file name prefix of an icon URL."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+
+class SonyBraviaIconCache:
+    """Keep app icons in a size bounded LRU in memory and on disk, fetching each from the TV only once."""
+
+    def __init__(self, hass: HomeAssistant, session_factory) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.session_factory = session_factory
+        self.location = hass.config.path(DOMAIN, ICON_CACHE_DIR)
+        self.memory: OrderedDict[str, tuple[bytes, str]] = OrderedDict()
+        self.memory_size = 0
+        self.disk: OrderedDict[str, tuple[str, int]] | None = None
+        self.disk_size = 0
+        self.pending: dict[str, asyncio.Future] = {}
+        self.semaphore = asyncio.Semaphore(ICON_CONCURRENCY)
+
+    def get_hash(self, url: str) -> str | None:
+        """Return the content hash of a cached icon."""
+        if self.disk is None or (entry := self.disk.get(get_key(url))) is None:
+            return None
+        return entry[0]
+
+    async def async_load(self) -> None:
+        """Index the icons saved on disk, least recently used first."""
+        if self.disk is None:
+            entries = await self.hass.async_add_executor_job(self._load)
+            self.disk = OrderedDict((key, (content_hash, size)) for _, key, content_hash, size in sorted(entries))
+            self.disk_size = sum(size for _, size in self.disk.values())
+
+    def _load(self) -> list[tuple[float, str, str, int]]:
+        """Return the last use, key, content hash and size of every icon on disk."""
+        os.makedirs(self.location, exist_ok=True)
+        entries = []
+        for name in os.listdir(self.location):
+            key, _, content_hash = name.partition("-")
+            if content_hash and not name.endswith(".tmp"):
+                stat = os.stat(os.path.join(self.location, name))
+                entries.append((stat.st_mtime, key, content_hash, stat.st_size))
+        return entries
+
+    async def async_get(self, url: str) -> tuple[bytes | None, str | None]:
+        """Return an icon from memory, from disk or from the TV, in that order."""
+        key = get_key(url)
+        if (entry := self.memory.get(key)) is not None:
+            self.memory.move_to_end(key)
+            return entry[0], get_content_type(entry[0])
+
+        await self.async_load()
+        if (entry := self.disk.get(key)) is not None:
+            content_hash, size = entry
+            self.disk.move_to_end(key)
+            content = await self.hass.async_add_executor_job(self._read, f"{key}-{content_hash}")
+            if content is not None:
+                self._remember(key, content, content_hash)
+                return content, get_content_type(content)
+            if self.disk.get(key) == entry:
+                del self.disk[key]
+                self.disk_size -= size
+
+        content = await self.async_fetch(url)
+        if content is None:
+            return None, None
+        return content, get_content_type(content)
+
+    async def async_fetch(self, url: str) -> bytes | None:
+        """Fetch an icon from the TV, sharing the request between concurrent callers."""
+        key = get_key(url)
+        if (future := self.pending.get(key)) is not None:
+            return await asyncio.shield(future)
+
+        future = self.hass.loop.create_future()
+        self.pending[key] = future
+        content = None
+        try:
+            async with self.semaphore:
+                content = await read_icon(self.session_factory(), url, ICON_MAX_SIZE, ICON_TIMEOUT)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as exception:
+            _LOGGER.debug("Error fetching icon %s: %s", url, exception)
+        finally:
+            self.pending.pop(key, None)
+            future.set_result(content)
+
+        if content is not None:
+            content_hash = hashlib.sha256(content).hexdigest()[:16]
+            self._remember(key, content, content_hash)
+            await self.async_load()
+            removed = self._index(key, content_hash, len(content))
+            await self.hass.async_add_executor_job(self._write, f"{key}-{content_hash}", content, removed)
+        return content
+
+    @callback
+    def async_prefetch(self, urls: Iterable[str]) -> None:
+        """Fetch every icon that is not cached yet in the background."""
+        self.hass.async_create_background_task(self._async_prefetch(list(urls)), "braviatv icon prefetch")
+
+    async def _async_prefetch(self, urls: list[str]) -> None:
+        """Fetch the missing icons."""
+        await self.async_load()
+        missing = [url for url in dict.fromkeys(urls) if get_key(url) not in self.disk]
+        await asyncio.gather(*[self.async_fetch(url) for url in missing])
+
+    def _remember(self, key: str, content: bytes, content_hash: str) -> None:
+        """Add an icon to memory, dropping the least recently used ones past the size bound."""
+        if key in self.memory:
+            self.memory_size -= len(self.memory.pop(key)[0])
+        self.memory[key] = (content, content_hash)
+        self.memory_size += len(content)
+        while self.memory_size > ICON_MEMORY_SIZE and len(self.memory) > 1:
+            _, (dropped, _) = self.memory.popitem(last=False)
+            self.memory_size -= len(dropped)
+
+    def _index(self, key: str, content_hash: str, size: int) -> list[str]:
+        """Add an icon to the disk index, returning the files to remove past the size bound."""
+        removed = []
+        if (entry := self.disk.pop(key, None)) is not None:
+            self.disk_size -= entry[1]
+            if entry[0] != content_hash:
+                removed.append(f"{key}-{entry[0]}")
+        self.disk[key] = (content_hash, size)
+        self.disk_size += size
+        while self.disk_size > ICON_DISK_SIZE and len(self.disk) > 1:
+            evicted, (evicted_hash, evicted_size) = self.disk.popitem(last=False)
+            self.disk_size -= evicted_size
+            removed.append(f"{evicted}-{evicted_hash}")
+        return removed
+
+    def _read(self, name: str) -> bytes | None:
+        """Read an icon from disk and mark it as recently used."""
+        path = os.path.join(self.location, name)
+        try:
+            with open(path, "rb") as file:
+                content = file.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return content
+
+    def _write(self, name: str, content: bytes, removed: list[str]) -> None:
+        """Write an icon to disk and remove the files that left the index."""
+        os.makedirs(self.location, exist_ok=True)
+        path = os.path.join(self.location, name)
+        with open(f"{path}.tmp", "wb") as file:
+            file.write(content)
+        os.replace(f"{path}.tmp", path)
+        for removed_name in removed:
+            try:
+                os.remove(os.path.join(self.location, removed_name))
+            except FileNotFoundError:
+                pass
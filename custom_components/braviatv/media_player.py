@@ -4,8 +4,6 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
-import voluptuous as vol
-
 from homeassistant.components.media_player import (
     MediaPlayerDeviceClass,
     MediaPlayerEntity,
@@ -22,26 +20,26 @@ from homeassistant.const import (
     STATE_ON,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import config_validation as cv, entity_platform
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import entity_platform
 
 from . import SonyBraviaEntity
+from .client import SonyBraviaException
 from .const import (
-    ATTR_APP,
     ATTR_APP_LIST,
-    ATTR_COMMAND,
     ATTR_COMMAND_LIST,
     DATA_COORDINATOR,
+    DATA_HUB,
     CONF_12H,
     CONF_EXT_SPEAKER,
     CONF_SOURCE,
     CONF_SOURCE_CONFIG,
     CONF_TIME_FORMAT,
     DOMAIN,
-    SERVICE_OPEN_APP,
-    SERVICE_SEND_COMMAND,
+    SERVICE_REFRESH_METADATA,
     SOURCE_APP,
 )
+from .coordinator import SonyBraviaCoordinator
 
 SUPPORTED_FEATURES = (
     MediaPlayerEntityFeature.PAUSE |
@@ -68,31 +66,27 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
 
     platform = entity_platform.current_platform.get()
     platform.async_register_entity_service(
-        SERVICE_OPEN_APP,
-        {
-            vol.Required(ATTR_APP): cv.string,
-        },
-        "open_app",
-    )
-    platform.async_register_entity_service(
-        SERVICE_SEND_COMMAND,
-        {
-            vol.Required(ATTR_COMMAND): cv.string,
-        },
-        "send_command",
+        SERVICE_REFRESH_METADATA,
+        {},
+        "async_refresh_metadata",
     )
 
-    async_add_entities([SonyBraviaTelevision(coordinator, ext_speaker, source_config, time_format)], True)
+    async_add_entities([SonyBraviaTelevision(coordinator, ext_speaker, source_config, time_format)])
 
 
 class SonyBraviaTelevision(MediaPlayerEntity, SonyBraviaEntity):
     """Representation of a Sony TV."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator, ext_speaker: bool, source_config: Mapping[str, str], time_format: str):
+    def __init__(self, coordinator: SonyBraviaCoordinator, ext_speaker: bool, source_config: Mapping[str, str], time_format: str):
         """Initialize device."""
         super().__init__(coordinator)
         self._app_icon = None
         self._app_title = None
+        self._conf_device = None
+        self._conf_source = None
+        self._conf_source_list = None
+        self._conf_sources = None
+        self._conf_title = None
         self._ext_speaker = ext_speaker
         self._playing = False
         self._source_config = source_config
@@ -102,18 +96,34 @@ class SonyBraviaTelevision(MediaPlayerEntity, SonyBraviaEntity):
     @property
     def conf_sources(self) -> Mapping[str, str] | None:
         """List of available input sources."""
-        return self._apply_source_config(self.device.sources)
+        self._update_conf()
+        return self._conf_sources
 
     @property
     def conf_title(self) -> str | None:
         """Name of the current running app."""
-        return self._apply_source_config_name(self.device.title)
+        self._update_conf()
+        return self._conf_title
+
+    def _update_conf(self) -> None:
+        """Apply the source config once per device snapshot."""
+        device = self.device
+        if device is not self._conf_device:
+            self._conf_device = device
+            self._conf_sources = self._apply_source_config(device.sources)
+            self._conf_source_list = list(self._conf_sources)
+            self._conf_title = self._apply_source_config_name(device.title)
+            if device.source_name:
+                self._conf_source = self._apply_source_config_name(device.source_name)
+            else:
+                self._conf_source = self._conf_title
 
     def _apply_source_config(self, sources: Mapping[str, str]) -> Mapping[str, str] | None:
         if self._source_config:
             conf_sources = {}
+            conf_source_names = {conf[CONF_SOURCE] for conf in self._source_config}
             for source, uri in sources.items():
-                if source in [conf[CONF_SOURCE] for conf in self._source_config]:
+                if source in conf_source_names:
                     name = self._apply_source_config_name(source)
                     conf_sources[name] = uri
             return conf_sources
@@ -191,6 +201,19 @@ class SonyBraviaTelevision(MediaPlayerEntity, SonyBraviaEntity):
             return None
         return SOURCE_APP
 
+    @property
+    def media_image_hash(self) -> str | None:
+        """Hash of the cached app icon, stable for as long as its content is."""
+        if self._app_icon and (content_hash := self.coordinator.hub.icons.get_hash(self._app_icon)):
+            return content_hash
+        return super().media_image_hash
+
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """Serve the app icon from the local cache instead of the TV."""
+        if self._app_icon:
+            return await self.coordinator.hub.icons.async_get(self._app_icon)
+        return await super().async_get_media_image()
+
     @property
     def media_image_url(self) -> str | None:
         """Image url of current playing media."""
@@ -229,13 +252,14 @@ class SonyBraviaTelevision(MediaPlayerEntity, SonyBraviaEntity):
         if self._app_title:
             return self._app_title
         elif self.conf_title:
-            return self.conf_title
+            return self._conf_source
         return SOURCE_APP
 
     @property
     def source_list(self) -> list[str] | None:
         """List of available input sources."""
-        return list(self.conf_sources.keys())
+        self._update_conf()
+        return self._conf_source_list
 
     @property
     def state(self) -> str | None:
@@ -255,10 +279,10 @@ class SonyBraviaTelevision(MediaPlayerEntity, SonyBraviaEntity):
 
         if self.device.is_on:
             if self.device.apps:
-                attrs[ATTR_APP_LIST] = sorted(list(self.device.apps.keys()))
+                attrs[ATTR_APP_LIST] = self.device.app_names
 
             if self.device.commands:
-                attrs[ATTR_COMMAND_LIST] = sorted(list(self.device.commands.keys()))
+                attrs[ATTR_COMMAND_LIST] = self.device.command_names
 
         return attrs
 
@@ -276,90 +300,121 @@ class SonyBraviaTelevision(MediaPlayerEntity, SonyBraviaEntity):
             return int(self.device.volume) / 100
         return None
 
-    def set_volume_level(self, volume: float) -> None:
-        """Set volume level, range 0..1."""
-        volume = str(int(round(volume * 100)))
-        setattr(self.device, "volume_level", volume)
-
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
-        await super().async_set_volume_level(volume)
-        await self.coordinator.async_request_refresh()
+        volume = int(round(volume * 100))
+        # Apply first, a burst of calls coalesces and only the last value is sent
+        self.coordinator.async_apply(volume_info={**self.device.volume_info, "volume": volume})
+        try:
+            await self.device.set_volume(str(volume))
+        finally:
+            self.coordinator.async_schedule_confirm("volume_info")
 
-    def turn_on(self) -> None:
+    async def async_turn_on(self, **kwargs) -> None:
         """Turn the media player on."""
-        setattr(self.device, "power_status", True)
+        await self.device.set_power_status(True)
         self._reset_app_info()
+        self.coordinator.async_apply(power_status="active")
+        self.coordinator.async_schedule_confirm("power_status")
 
-    async def async_turn_on(self, **kwargs) -> None:
-        await super().async_turn_on()
-        await self.coordinator.async_request_refresh()
-
-    def turn_off(self) -> None:
+    async def async_turn_off(self, **kwargs) -> None:
         """Turn the media player off."""
-        setattr(self.device, "power_status", False)
+        await self.device.set_power_status(False)
         self._reset_app_info()
+        self.coordinator.async_apply(power_status="standby")
+        self.coordinator.async_schedule_confirm("power_status")
 
-    async def async_turn_off(self, **kwargs) -> None:
-        await super().async_turn_off()
-        await self.coordinator.async_request_refresh()
-
-    def volume_up(self) -> None:
+    async def async_volume_up(self) -> None:
         """Turn volume up for media player."""
-        self.device.send_command(self.device.commands["VolumeUp"])
+        await self.device.send_command(self.device.commands["VolumeUp"])
+        await self.coordinator.async_boost()
 
-    def volume_down(self) -> None:
+    async def async_volume_down(self) -> None:
         """Turn volume down for media player."""
-        self.device.send_command(self.device.commands["VolumeDown"])
-
-    def mute_volume(self, mute: bool) -> None:
-        """Mute the volume."""
-        setattr(self.device, "mute", bool(mute))
+        await self.device.send_command(self.device.commands["VolumeDown"])
+        await self.coordinator.async_boost()
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute the volume."""
-        await super().async_mute_volume(mute)
-        await self.coordinator.async_request_refresh()
+        await self.device.set_mute(bool(mute))
+        self.coordinator.async_apply(volume_info={**self.device.volume_info, "mute": bool(mute)})
+        self.coordinator.async_schedule_confirm("volume_info")
 
-    def select_source(self, source: str) -> None:
+    async def async_select_source(self, source: str) -> None:
         """Select input source."""
-        if source in list(self.conf_sources.keys()):
-            self.device.set_play_content(self.conf_sources[source])
+        if source in self.conf_sources:
+            await self.device.set_play_content(self.conf_sources[source])
             self._reset_app_info()
+            self.async_write_ha_state()
+            await self.coordinator.async_boost()
 
-    def media_play(self) -> None:
+    async def async_media_play(self) -> None:
         """Send play command."""
-        self.device.send_command(self.device.commands["Play"])
+        await self.device.send_command(self.device.commands["Play"])
         self._playing = True
+        await self.coordinator.async_boost()
 
-    def media_pause(self) -> None:
+    async def async_media_pause(self) -> None:
         """Send pause command."""
         command = "TvPause" if self.device.tv_input_active else "Pause"
-        self.device.send_command(self.device.commands[command])
+        await self.device.send_command(self.device.commands[command])
         self._playing = False
+        await self.coordinator.async_boost()
 
-    def media_stop(self) -> None:
+    async def async_media_stop(self) -> None:
         """Send stop command."""
-        self.device.send_command(self.device.commands["Stop"])
+        await self.device.send_command(self.device.commands["Stop"])
         self._playing = False
+        await self.coordinator.async_boost()
 
-    def media_next_track(self) -> None:
+    async def async_media_next_track(self) -> None:
         """Send next track command."""
         command = "ChannelUp" if self.device.tv_input_active else "Next"
-        self.device.send_command(self.device.commands[command])
+        await self.device.send_command(self.device.commands[command])
+        await self.coordinator.async_boost()
 
-    def media_previous_track(self) -> None:
+    async def async_media_previous_track(self) -> None:
         """Send previous track command."""
         command = "ChannelDown" if self.device.tv_input_active else "Prev"
-        self.device.send_command(self.device.commands[command])
+        await self.device.send_command(self.device.commands[command])
+        await self.coordinator.async_boost()
 
-    def open_app(self, app: str) -> None:
-        """Open an app on the media player."""
-        if self.device.is_on and app in list(self.device.apps.keys()):
-            self.device.set_active_app(self.device.apps[app]["uri"])
-            self._app_icon = self.device.apps[app].get("icon")
-            self._app_title = app
+    async def async_added_to_hass(self) -> None:
+        """Make the entity a target of the services of every TV."""
+        await super().async_added_to_hass()
+        self.hass.data[DOMAIN][DATA_HUB].entities[self.entity_id] = self
 
-    def send_command(self, command: str) -> None:
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop being a target of the services of every TV."""
+        self.hass.data[DOMAIN][DATA_HUB].entities.pop(self.entity_id, None)
+        await super().async_will_remove_from_hass()
+
+    async def async_open_app(self, app: str) -> None:
+        """Open an app on the media player."""
+        if app not in self.device.apps:
+            raise ServiceValidationError(f"Unknown app: {app}")
+        if not self.device.is_on:
+            raise HomeAssistantError(f"Cannot open {app}, {self.name} is off")
+        try:
+            await self.device.set_active_app(self.device.apps[app]["uri"])
+        except SonyBraviaException as exception:
+            raise HomeAssistantError(f"Error opening app: {exception}") from exception
+        self._app_icon = self.device.apps[app].get("icon")
+        self._app_title = app
+        self.async_write_ha_state()
+        await self.coordinator.async_boost()
+
+    async def async_refresh_metadata(self) -> None:
+        """Refresh the apps, commands and sources of the media player."""
+        self.device.client.invalidate()
+        await self.coordinator.async_boost()
+
+    async def async_send_command(self, command: str) -> None:
         """Send a command to the media player."""
-        self.device.send_command(self.device.commands[command])
+        if command not in self.device.commands:
+            raise ServiceValidationError(f"Unknown command: {command}")
+        try:
+            await self.device.send_command(self.device.commands[command])
+        except SonyBraviaException as exception:
+            raise HomeAssistantError(f"Error sending command: {exception}") from exception
+        await self.coordinator.async_boost()
@@ -4,18 +4,29 @@ from __future__ import annotations
 from collections.abc import Iterable, Mapping
 from typing import Any, final
 
-from homeassistant.components.remote import DOMAIN as DOMAIN_REMOTE, RemoteEntity
+from homeassistant.components.remote import (
+    ATTR_DELAY_SECS,
+    ATTR_HOLD_SECS,
+    ATTR_NUM_REPEATS,
+    DEFAULT_DELAY_SECS,
+    DEFAULT_HOLD_SECS,
+    DEFAULT_NUM_REPEATS,
+    DOMAIN as DOMAIN_REMOTE,
+    RemoteEntity,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import SonyBraviaEntity
+from .client import SonyBraviaException
 from .const import (
     ATTR_COMMAND_LIST,
     DATA_COORDINATOR,
     DOMAIN,
 )
+from .coordinator import SonyBraviaCoordinator
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
@@ -23,13 +34,13 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     entry = hass.data[DOMAIN][config_entry.entry_id]
     coordinator = entry[DATA_COORDINATOR]
 
-    async_add_entities([SonyBraviaRemote(coordinator)], True)
+    async_add_entities([SonyBraviaRemote(coordinator)])
 
 
 class SonyBraviaRemote(RemoteEntity, SonyBraviaEntity):
     """Device that sends commands to a Sony TV."""
 
-    def __init__(self, coordinator: DataUpdateCoordinator):
+    def __init__(self, coordinator: SonyBraviaCoordinator):
         """Initialize device."""
         super().__init__(coordinator)
         self._unique_id = f"{self.device.serial}-{DOMAIN_REMOTE}"
@@ -52,29 +63,39 @@ class SonyBraviaRemote(RemoteEntity, SonyBraviaEntity):
             attrs = {}
 
         if self.device.is_on and self.device.commands:
-            attrs[ATTR_COMMAND_LIST] = sorted(list(self.device.commands.keys()))
+            attrs[ATTR_COMMAND_LIST] = self.device.command_names
 
         return attrs
 
-    def send_command(self, commands: Iterable[str], **kwargs: Any) -> None:
+    async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
         """Send commands to a device."""
-        for command in commands:
-            self.device.send_command(command)
-
-    def turn_on(self, **kwargs: Any) -> None:
-        """Turn the entity on."""
-        setattr(self.device, "power_status", True)
+        commands = self.device.commands
+        codes = []
+        for name in command:
+            if name in commands:
+                codes.append(commands[name])
+            elif name in commands.values():
+                codes.append(name)
+            else:
+                raise ServiceValidationError(f"Unknown command: {name}")
+
+        try:
+            await self.device.send_command_sequence(
+                codes,
+                repeats=kwargs.get(ATTR_NUM_REPEATS, DEFAULT_NUM_REPEATS),
+                delay=kwargs.get(ATTR_DELAY_SECS, DEFAULT_DELAY_SECS),
+                hold=kwargs.get(ATTR_HOLD_SECS, DEFAULT_HOLD_SECS),
+            )
+        except SonyBraviaException as exception:
+            raise HomeAssistantError(f"Error sending command: {exception}") from exception
+        await self.coordinator.async_boost()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        await super().async_turn_on()
-        await self.coordinator.async_request_refresh()
-
-    def turn_off(self, **kwargs: Any) -> None:
-        """Turn the entity off."""
-        setattr(self.device, "power_status", False)
+        await self.device.set_power_status(True)
+        await self.coordinator.async_boost()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        await super().async_turn_off()
-        await self.coordinator.async_request_refresh()
+        await self.device.set_power_status(False)
+        await self.coordinator.async_boost()
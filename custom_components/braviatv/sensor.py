@@ -0,0 +1,93 @@
+"""Support for Sony BRAVIA diagnostic sensors."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.components.sensor import (
+    DOMAIN as DOMAIN_SENSOR,
+    SensorDeviceClass,
+    SensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import SonyBraviaEntity
+from .const import (
+    ATTR_ENDPOINTS,
+    ATTR_POLL_MODE,
+    DATA_COORDINATOR,
+    DOMAIN,
+)
+from .coordinator import SonyBraviaCoordinator
+
+
+async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
+    """Set up Sony BRAVIA sensor entities based on a config entry."""
+    entry = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = entry[DATA_COORDINATOR]
+
+    async_add_entities([
+        SonyBraviaPollIntervalSensor(coordinator),
+        SonyBraviaRequestLatencySensor(coordinator),
+    ])
+
+
+class SonyBraviaPollIntervalSensor(SensorEntity, SonyBraviaEntity):
+    """Current poll interval of a Sony TV."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+
+    def __init__(self, coordinator: SonyBraviaCoordinator):
+        """Initialize device."""
+        super().__init__(coordinator)
+        self._unique_id = f"{self.device.serial}-{DOMAIN_SENSOR}-poll_interval"
+
+    @property
+    def name(self) -> str | None:
+        """Return the name of the entity."""
+        return f"{super().name} Poll Interval"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the current poll interval."""
+        return self.coordinator.poll_interval
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Return the current poll mode."""
+        return {ATTR_POLL_MODE: self.coordinator.poll_mode}
+
+
+class SonyBraviaRequestLatencySensor(SensorEntity, SonyBraviaEntity):
+    """Mean request latency of a Sony TV, with per endpoint statistics."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _unrecorded_attributes = frozenset({ATTR_ENDPOINTS})
+
+    def __init__(self, coordinator: SonyBraviaCoordinator):
+        """Initialize device."""
+        super().__init__(coordinator)
+        self._unique_id = f"{self.device.serial}-{DOMAIN_SENSOR}-request_latency"
+
+    @property
+    def name(self) -> str | None:
+        """Return the name of the entity."""
+        return f"{super().name} Request Latency"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean latency of all requests."""
+        return round(self.coordinator.client.stats.latency_mean * 1000, 1)
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Return the statistics of every endpoint."""
+        return {ATTR_ENDPOINTS: self.coordinator.client.stats.as_dict()}
@@ -0,0 +1,79 @@
+"""Services that target several Sony Bravia TVs at once."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+import async_timeout
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_entity_ids
+
+from .const import (
+    ATTR_APP,
+    ATTR_COMMAND,
+    ATTR_ERROR,
+    ATTR_SUCCESS,
+    DATA_HUB,
+    DOMAIN,
+    SERVICE_OPEN_APP,
+    SERVICE_SEND_COMMAND,
+    SERVICE_TIMEOUT,
+)
+
+SERVICES = {
+    SERVICE_OPEN_APP: (ATTR_APP, "async_open_app"),
+    SERVICE_SEND_COMMAND: (ATTR_COMMAND, "async_send_command"),
+}
+
+
+async def async_call_entity(action: Awaitable[None]) -> dict[str, Any]:
+    """Run the action of one TV and report its outcome instead of raising."""
+    try:
+        async with async_timeout.timeout(SERVICE_TIMEOUT):
+            await action
+    except asyncio.TimeoutError:
+        return {ATTR_SUCCESS: False, ATTR_ERROR: f"No answer within {SERVICE_TIMEOUT}s"}
+    except HomeAssistantError as exception:
+        return {ATTR_SUCCESS: False, ATTR_ERROR: str(exception)}
+    return {ATTR_SUCCESS: True}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services that fan out to every target TV concurrently."""
+
+    async def async_handle_service(call: ServiceCall) -> ServiceResponse:
+        """Send the call to all target TVs at the same time."""
+        entities = hass.data[DOMAIN][DATA_HUB].entities
+        attr, method = SERVICES[call.service]
+        targets = [entity_id for entity_id in await async_extract_entity_ids(hass, call) if entity_id in entities]
+        results = await asyncio.gather(*[
+            async_call_entity(getattr(entities[entity_id], method)(call.data[attr]))
+            for entity_id in targets
+        ])
+        response = dict(zip(targets, results))
+        if not call.return_response:
+            failed = [entity_id for entity_id, result in response.items() if not result[ATTR_SUCCESS]]
+            if failed:
+                raise HomeAssistantError(f"{call.service} failed for: {', '.join(failed)}")
+            return None
+        return response
+
+    for service, (attr, _) in SERVICES.items():
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            async_handle_service,
+            schema=cv.make_entity_service_schema({vol.Required(attr): cv.string}),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the services along with the last TV."""
+    for service in SERVICES:
+        hass.services.async_remove(DOMAIN, service)
@@ -0,0 +1,55 @@
+"""Tests for the circuit breaker of AsyncSonyBraviaClient.
+
+    python -m pytest tests
+"""
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "custom_components", "braviatv"))
+
+from client import AsyncSonyBraviaClient, SonyBraviaConnectionError  # noqa: E402
+from client.const import PROBE_TIMEOUT  # noqa: E402
+
+METADATA = dict(
+    interface_info=dict(productCategory="tv", modelName="KD-55X85J"),
+    system_info=dict(serial="1234567", macAddr="00:11:22:33:44:55"),
+    timestamp=time.time(),
+)
+
+
+async def silent_server():
+    # Accepts connections and never answers, like a TV that was unplugged mid-session
+    async def handle(reader, writer):
+        await reader.read()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, f"127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+
+def test_open_breaker_update_only_costs_the_probe():
+    async def run():
+        server, host = await silent_server()
+        client = AsyncSonyBraviaClient(host=host, psk="0000")
+        try:
+            # Restored metadata expires the info, which must not be fetched while the breaker is open
+            client.restore(METADATA)
+            assert client.info_expired
+            for _ in range(client.breaker.threshold):
+                client.breaker.record_failure()
+            client.breaker.retry_timestamp = 0.0
+
+            start = time.monotonic()
+            with pytest.raises(SonyBraviaConnectionError):
+                await client.update()
+            assert time.monotonic() - start < PROBE_TIMEOUT + 1
+            assert client.info_expired
+        finally:
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(run())
@@ -0,0 +1,94 @@
+"""Tests for SonyBraviaDiscovery against local stand-in servers.
+
+    python -m pytest tests
+"""
+import asyncio
+import os
+import sys
+
+from aiohttp import web
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "custom_components", "braviatv"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from client.discovery import SonyBraviaDiscovery  # noqa: E402
+from fake_bravia import FakeBravia  # noqa: E402
+
+OTHER_ANSWERS = [
+    {"result": {"productCategory": "tv"}},
+    {"result": "tv"},
+    {"result": []},
+    {"result": [None]},
+    {"error": [404, "Not Found"]},
+    [1, 2],
+]
+
+
+async def json_server(body):
+    # Something else on the network that answers /sony/system with arbitrary JSON
+    async def handle(request):
+        return web.json_response(body)
+
+    app = web.Application()
+    app.router.add_post("/sony/system", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    host, port = runner.addresses[0][:2]
+    return runner, f"{host}:{port}"
+
+
+def test_probe_accepts_only_tvs():
+    async def run():
+        tv = FakeBravia(name="BRAVIA 1", model="KD-65A90J")
+        soundbar = FakeBravia(name="Soundbar")
+        soundbar.interface_info["productCategory"] = "audioSystem"
+        discovery = SonyBraviaDiscovery(timeout=1.0)
+        try:
+            result = await discovery.probe(await tv.start())
+            assert result["model_name"] == "KD-65A90J"
+            assert result["interface_info"]["productCategory"] == "tv"
+            assert await discovery.probe(await soundbar.start()) is None
+        finally:
+            await discovery.close()
+            await tv.stop()
+            await soundbar.stop()
+
+    asyncio.run(run())
+
+
+def test_scan_skips_other_devices_and_dead_hosts():
+    async def run():
+        tvs = [FakeBravia(serial=f"{index:07d}") for index in range(3)]
+        hosts = [await tv.start() for tv in tvs]
+        runners = []
+        for body in OTHER_ANSWERS:
+            runner, host = await json_server(body)
+            runners.append(runner)
+            hosts.append(host)
+        # Nothing listens on the port a server just released
+        dead, dead_host = await json_server({})
+        await dead.cleanup()
+        hosts.append(dead_host)
+
+        discovery = SonyBraviaDiscovery(timeout=1.0)
+        try:
+            found = await discovery.scan(hosts)
+            assert sorted(result["host"] for result in found) == sorted(hosts[:3])
+        finally:
+            await discovery.close()
+            for tv in tvs:
+                await tv.stop()
+            for runner in runners:
+                await runner.cleanup()
+
+    asyncio.run(run())
+
+
+def test_get_hosts():
+    assert SonyBraviaDiscovery.get_hosts("192.168.1.10") == ["192.168.1.10"]
+    assert len(SonyBraviaDiscovery.get_hosts("192.168.1.0/24")) == 254
+    with pytest.raises(ValueError):
+        SonyBraviaDiscovery.get_hosts("10.0.0.0/8")
@@ -0,0 +1,53 @@
+"""Tests for reading app icons from a TV.
+
+    python -m pytest tests
+"""
+import asyncio
+import os
+import sys
+
+import aiohttp
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "custom_components", "braviatv"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from client.icon import read_icon  # noqa: E402
+from fake_bravia import FakeBravia  # noqa: E402
+
+MAX_SIZE = 262144
+
+
+async def fetch(icon_size, max_size=MAX_SIZE):
+    server = FakeBravia(apps=1, icon_size=icon_size)
+    address = await server.start()
+    try:
+        async with aiohttp.ClientSession() as session:
+            content = await read_icon(session, f"http://{address}/icons/app0.png", max_size, 5)
+    finally:
+        await server.stop()
+    return content, server.get_icon("app0.png")
+
+
+def test_icon_larger_than_one_chunk_is_read_whole():
+    content, expected = asyncio.run(fetch(204800))
+    assert len(content) == 204800
+    assert content == expected
+
+
+def test_icon_over_the_size_bound_is_rejected():
+    content, _ = asyncio.run(fetch(MAX_SIZE + 1))
+    assert content is None
+
+
+def test_missing_icon_is_rejected():
+    async def run():
+        server = FakeBravia(apps=1)
+        address = await server.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                return await read_icon(session, f"http://{address}/missing/app0.png", MAX_SIZE, 5)
+        finally:
+            await server.stop()
+
+    assert asyncio.run(run()) is None
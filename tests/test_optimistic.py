@@ -0,0 +1,45 @@
+"""Tests for optimistic values applied to AsyncSonyBraviaClient.
+
+    python -m pytest tests
+"""
+import asyncio
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "custom_components", "braviatv"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from client import AsyncSonyBraviaClient  # noqa: E402
+from fake_bravia import FakeBravia  # noqa: E402
+
+NO_LATENCY = dict(appControl=0.0, audio=0.0, avContent=0.0, IRCC=0.0, system=0.0)
+
+
+def test_poll_in_flight_does_not_overwrite_applied_value():
+    async def run():
+        server = FakeBravia(apps=5, channels=5, latency=NO_LATENCY)
+        client = AsyncSonyBraviaClient(host=await server.start(), psk=server.psk)
+        try:
+            device = await client.update()
+            assert device.volume == 15
+
+            server.latency["audio"] = 0.2
+            client.last_update_timestamp = 0
+            poll = asyncio.ensure_future(client.update())
+            await asyncio.sleep(0.05)
+            device = client.apply(volume_info={**device.volume_info, "volume": 40})
+            assert device.volume == 40
+
+            # The poll read the volume before the action, its result is dropped
+            device = await poll
+            assert device.volume == 40
+
+            # Reads started after the action are merged as usual
+            device = await client.confirm("volume_info")
+            assert device.volume == 15
+        finally:
+            await client.close()
+            await server.stop()
+
+    asyncio.run(run())
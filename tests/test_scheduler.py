@@ -0,0 +1,72 @@
+"""Tests for SonyBraviaScheduler.
+
+    python -m pytest tests
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "custom_components", "braviatv"))
+
+from client.const import PRIORITY_COMMAND, PRIORITY_POLL  # noqa: E402
+from client.scheduler import SonyBraviaScheduler  # noqa: E402
+
+
+async def hold(scheduler, priority, order, name, started=None, release=None):
+    await scheduler.acquire(priority)
+    try:
+        order.append(name)
+        if started is not None:
+            started.set()
+        if release is not None:
+            await release.wait()
+        else:
+            await asyncio.sleep(0)
+    finally:
+        scheduler.release(asyncio.current_task())
+
+
+def test_command_preempts_running_poll():
+    async def run():
+        scheduler = SonyBraviaScheduler(concurrency=1)
+        order = []
+        started = asyncio.Event()
+        poll = asyncio.ensure_future(hold(scheduler, PRIORITY_POLL, order, "poll", started, asyncio.Event()))
+        await started.wait()
+        await hold(scheduler, PRIORITY_COMMAND, order, "command")
+        try:
+            await poll
+        except asyncio.CancelledError:
+            pass
+        assert poll.cancelled()
+        assert order == ["poll", "command"]
+        assert not scheduler.active
+
+    asyncio.run(run())
+
+
+def test_command_takes_slot_granted_to_poll_that_has_not_resumed():
+    async def run():
+        scheduler = SonyBraviaScheduler(concurrency=1)
+        order = []
+
+        async def first():
+            await scheduler.acquire(PRIORITY_POLL)
+            order.append("first")
+            await asyncio.sleep(0.01)
+            # The slot goes to the waiting poll, the command arrives before that poll resumes
+            scheduler.release(asyncio.current_task())
+            assert len(scheduler.active) == 1
+            await hold(scheduler, PRIORITY_COMMAND, order, "command")
+
+        first_task = asyncio.ensure_future(first())
+        await asyncio.sleep(0)
+        waiting = asyncio.ensure_future(hold(scheduler, PRIORITY_POLL, order, "waiting"))
+        await asyncio.gather(first_task, waiting)
+
+        assert not waiting.cancelled()
+        assert order == ["first", "command", "waiting"]
+        assert not scheduler.active
+        assert not scheduler.revoked
+
+    asyncio.run(run())